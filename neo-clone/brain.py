@@ -894,6 +894,7 @@ class Brain:
         if required_capabilities is None:
             required_capabilities = ["reasoning"]
 
+        required = frozenset(required_capabilities)
         best_model = None
         best_score = -1
 
@@ -902,7 +903,7 @@ class Brain:
             response_time = model_data.get("response_time", 10.0)
 
             # Check if model has required capabilities
-            if all(cap in capabilities for cap in required_capabilities):
+            if required.issubset(capabilities):
                 # Calculate score
                 score = len(capabilities) * 10 - response_time * 2
 
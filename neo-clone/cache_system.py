@@ -26,6 +26,9 @@ import logging
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Sort key for entries without a TTL under TTL eviction (they never expire)
+_NO_TTL = float('inf')
+
 
 class CacheStrategy(Enum):
     """Cache eviction strategies"""
@@ -520,7 +523,7 @@ class CacheSystem:
         
         elif self.strategy == CacheStrategy.TTL:
             # Shortest TTL first
-            return min(candidates, key=lambda k: self._cache[k].ttl or float('inf'))
+            return min(candidates, key=lambda k: self._cache[k].ttl or _NO_TTL)
         
         elif self.strategy == CacheStrategy.PRIORITY:
             # Lowest priority first
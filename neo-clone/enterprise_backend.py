@@ -16,19 +16,48 @@ Version: 1.0
 """
 
 import asyncio
+import copy
+import functools
+import hashlib
 import json
 import logging
+import os
 import time
-from typing import Dict, List, Any, Optional, Callable, Tuple
+from types import MappingProxyType
+from collections import OrderedDict, deque
+from itertools import count
+from typing import Dict, Any, Optional, Callable, Mapping, Tuple
 from pathlib import Path
 from dataclasses import dataclass, field
 from enum import Enum
 import sys
 
+# orjson is an optional, faster serializer for response cache keys
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# uvloop is an optional, faster event loop (not available on Windows)
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Request/response history is kept for inspection only; metrics come from
+# running totals, so retention can be bounded
+HISTORY_MAXLEN = 10_000
+
+# Fallback request ids; a counter is cheaper than formatting a timestamp and
+# cannot collide within the same millisecond
+_request_sequence = count(1)
+
 class EnterpriseSystem(Enum):
     """Enterprise backend systems"""
     FRAMEWORK_INTEGRATOR = "framework_integrator"
@@ -39,7 +68,31 @@ class EnterpriseSystem(Enum):
     ENHANCED_WEB_RESEARCH = "enhanced_web_research"
     PLAN_VERIFICATION = "plan_verification"
 
-@dataclass
+# Accepts both enum values ("framework_integrator") and names
+# ("FRAMEWORK_INTEGRATOR") without building an uppercased copy per call
+_SYSTEM_BY_NAME: Dict[str, EnterpriseSystem] = {system.value: system for system in EnterpriseSystem}
+_SYSTEM_BY_NAME.update({system.name: system for system in EnterpriseSystem})
+
+# Read-only metadata shared by every response the backend builds, so the
+# hot path does not allocate a dict per request
+_EMPTY_METADATA: Mapping[str, Any] = MappingProxyType({})
+_CACHE_HIT_METADATA: Mapping[str, Any] = MappingProxyType({"cache": "hit"})
+
+# Requests, responses and statuses are created per request and retained in
+# history, so drop the per-instance __dict__ where the interpreter allows it
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+SYSTEM_DISPLAY_NAMES = {
+    EnterpriseSystem.FRAMEWORK_INTEGRATOR: "Framework Integrator",
+    EnterpriseSystem.AI_MODEL_INTEGRATION: "AI Model Integration",
+    EnterpriseSystem.SPEC_DRIVEN_PLANNER: "Spec-Driven Planner",
+    EnterpriseSystem.TESTING_FRAMEWORK: "Testing Framework",
+    EnterpriseSystem.CODE_ANALYSIS_DEBUGGING: "Code Analysis & Debugging",
+    EnterpriseSystem.ENHANCED_WEB_RESEARCH: "Enhanced Web Research",
+    EnterpriseSystem.PLAN_VERIFICATION: "Plan Verification",
+}
+
+@dataclass(**_DATACLASS_OPTIONS)
 class EnterpriseSystemStatus:
     """Status of an enterprise system"""
     system: EnterpriseSystem
@@ -51,7 +104,7 @@ class EnterpriseSystemStatus:
     error_count: int = 0
     metadata: Dict[str, Any] = field(default_factory=dict)
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class EnterpriseRequest:
     """Request to enterprise backend"""
     request_id: str
@@ -62,7 +115,7 @@ class EnterpriseRequest:
     timeout: float = 30.0
     callback: Optional[Callable] = None
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class EnterpriseResponse:
     """Response from enterprise backend"""
     request_id: str
@@ -72,7 +125,51 @@ class EnterpriseResponse:
     result: Any
     execution_time: float
     error_message: Optional[str] = None
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    health_score: float = 1.0
+    metadata: Mapping[str, Any] = field(default_factory=dict)
+
+# Operations whose result depends only on their parameters (plus, for
+# FILE_KEYED_OPERATIONS, the file they read), mapped to how long (seconds)
+# a cached result stays valid. Stateful operations (test runs, plan
+# creation, framework calls), remote fetches (extract_content) and model
+# recommendations (ranked by live availability and latency) are
+# deliberately left out.
+CACHEABLE_OPERATIONS: Dict[Tuple[EnterpriseSystem, str], float] = {
+    (EnterpriseSystem.TESTING_FRAMEWORK, "get_recommendations"): 300,
+    (EnterpriseSystem.CODE_ANALYSIS_DEBUGGING, "analyze_code"): 300,
+    (EnterpriseSystem.CODE_ANALYSIS_DEBUGGING, "optimize_code"): 3600,
+    (EnterpriseSystem.PLAN_VERIFICATION, "run_quality_assurance"): 3600,
+}
+
+# Cacheable operations that read the file named by a parameter; the file's
+# mtime and size are part of the cache key so an edit invalidates the entry
+FILE_KEYED_OPERATIONS: Dict[Tuple[EnterpriseSystem, str], str] = {
+    (EnterpriseSystem.TESTING_FRAMEWORK, "get_recommendations"): "file_path",
+    (EnterpriseSystem.CODE_ANALYSIS_DEBUGGING, "analyze_code"): "file_path",
+}
+RESPONSE_CACHE_SIZE = 1024
+
+# Systems whose engines keep per-call state on the instance; their requests
+# are admitted one at a time instead of up to max_concurrency_per_system
+SERIALIZED_SYSTEMS = frozenset({
+    EnterpriseSystem.CODE_ANALYSIS_DEBUGGING,
+    EnterpriseSystem.PLAN_VERIFICATION,
+})
+
+def _dumps_sorted(payload: Any) -> bytes:
+    """Serialize a payload deterministically (sorted keys) to bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(
+            payload, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+        )
+    return json.dumps(payload, sort_keys=True, default=str).encode()
+
+@functools.lru_cache(maxsize=16)
+def _resolve_framework_type(framework_type: str):
+    """Map a framework name to FrameworkType, defaulting to LangChain"""
+    # Imported here so framework_integrator is only loaded when used
+    from framework_integrator import FrameworkType
+    return getattr(FrameworkType, framework_type.upper(), FrameworkType.LANGCHAIN)
 
 class EnterpriseBackend:
     """
@@ -88,205 +185,278 @@ class EnterpriseBackend:
     - Plan Verification: Implementation validation
     """
 
-    def __init__(self, workspace_dir: str = "."):
+    def __init__(self, workspace_dir: str = ".", max_concurrency_per_system: int = 16):
         self.workspace_dir = Path(workspace_dir)
+        self.max_concurrency_per_system = max_concurrency_per_system
         self.systems: Dict[EnterpriseSystem, Any] = {}
         self.system_status: Dict[EnterpriseSystem, EnterpriseSystemStatus] = {}
-        self.request_history: List[EnterpriseRequest] = []
-        self.response_history: List[EnterpriseResponse] = []
+        self.request_history: deque = deque(maxlen=HISTORY_MAXLEN)
+        self.response_history: deque = deque(maxlen=HISTORY_MAXLEN)
         self.initialized = False
 
+        # Per-system concurrency limits, created on first use so they bind to
+        # the loop that actually serves requests
+        self._semaphores: Dict[EnterpriseSystem, asyncio.Semaphore] = {}
+
+        # LRU of cache key -> (monotonic expiry, result) for CACHEABLE_OPERATIONS.
+        # Cached results are shared between responses and must be treated
+        # as read-only by callers.
+        self._response_cache: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+        # Running totals so metrics do not rescan the history
+        self._total_requests = 0
+        self._total_responses = 0
+        self._successful_responses = 0
+        self._total_execution_time = 0.0
+        # Per system: [requests, successful, total execution time]
+        self._per_system_stats: Dict[EnterpriseSystem, list] = {
+            system: [0, 0, 0.0] for system in EnterpriseSystem
+        }
+
         # Initialize system status tracking
         for system in EnterpriseSystem:
             self.system_status[system] = EnterpriseSystemStatus(system=system)
 
+        # Lazy initialization bookkeeping for _ensure_initialized
+        self._init_attempted: set = set()
+        self._init_locks: Dict[EnterpriseSystem, asyncio.Lock] = {}
+
+        # Component factories; coroutine factories run on the loop, plain
+        # ones in a worker thread
+        self._system_factories: Dict[EnterpriseSystem, Callable] = {
+            EnterpriseSystem.FRAMEWORK_INTEGRATOR: self._create_framework_integrator,
+            EnterpriseSystem.AI_MODEL_INTEGRATION: self._create_ai_model_integration,
+            EnterpriseSystem.SPEC_DRIVEN_PLANNER: self._create_spec_driven_planner,
+            EnterpriseSystem.TESTING_FRAMEWORK: self._create_testing_framework,
+            EnterpriseSystem.CODE_ANALYSIS_DEBUGGING: self._create_code_analysis_debugging,
+            EnterpriseSystem.ENHANCED_WEB_RESEARCH: self._create_enhanced_web_research,
+            EnterpriseSystem.PLAN_VERIFICATION: self._create_plan_verification,
+        }
+
+        # Operation dispatch table, built once: (system, operation) -> handler
+        self._operation_handlers: Dict[Tuple[EnterpriseSystem, str], Callable] = {
+            (EnterpriseSystem.FRAMEWORK_INTEGRATOR, "process_message"): self._framework_process_message,
+            (EnterpriseSystem.FRAMEWORK_INTEGRATOR, "execute_skill"): self._framework_execute_skill,
+            (EnterpriseSystem.AI_MODEL_INTEGRATION, "route_task"): self._models_route_task,
+            (EnterpriseSystem.AI_MODEL_INTEGRATION, "get_recommendations"): self._models_get_recommendations,
+            (EnterpriseSystem.SPEC_DRIVEN_PLANNER, "create_plan"): self._planner_create_plan,
+            (EnterpriseSystem.TESTING_FRAMEWORK, "auto_generate_tests"): self._testing_auto_generate_tests,
+            (EnterpriseSystem.TESTING_FRAMEWORK, "run_test_suite"): self._testing_run_test_suite,
+            (EnterpriseSystem.TESTING_FRAMEWORK, "get_recommendations"): self._testing_get_recommendations,
+            (EnterpriseSystem.CODE_ANALYSIS_DEBUGGING, "analyze_code"): self._analysis_analyze_code,
+            (EnterpriseSystem.CODE_ANALYSIS_DEBUGGING, "debug_code"): self._analysis_debug_code,
+            (EnterpriseSystem.CODE_ANALYSIS_DEBUGGING, "optimize_code"): self._analysis_optimize_code,
+            (EnterpriseSystem.ENHANCED_WEB_RESEARCH, "research_topic"): self._research_research_topic,
+            (EnterpriseSystem.ENHANCED_WEB_RESEARCH, "extract_content"): self._research_extract_content,
+            (EnterpriseSystem.ENHANCED_WEB_RESEARCH, "build_knowledge_graph"): self._research_build_knowledge_graph,
+            (EnterpriseSystem.PLAN_VERIFICATION, "verify_plan"): self._verification_verify_plan,
+            (EnterpriseSystem.PLAN_VERIFICATION, "validate_implementation"): self._verification_validate_implementation,
+            (EnterpriseSystem.PLAN_VERIFICATION, "run_quality_assurance"): self._verification_run_quality_assurance,
+        }
+
         logger.info("Enterprise Backend initialized")
 
     async def initialize_all_systems(self) -> Dict[str, bool]:
-        """Initialize all 7 enterprise systems"""
+        """Initialize all 7 enterprise systems concurrently"""
         logger.info("Initializing Enterprise Backend systems...")
 
-        results = {}
+        systems = list(EnterpriseSystem)
+        outcomes = await asyncio.gather(
+            *(self._ensure_initialized(system, retry=True) for system in systems)
+        )
+        results = {system.value: outcome for system, outcome in zip(systems, outcomes)}
 
-        # 1. Framework Integrator
-        try:
-            from framework_integrator import FrameworkIntegrator, create_enhanced_brain_with_frameworks
-            # Import enhanced brain for framework integration
-            from enhanced_brain import EnhancedBrain
-            from config import get_config
-
-            config = get_config()
-            enhanced_brain, integrator = await create_enhanced_brain_with_frameworks(
-                None, enable_frameworks=None  # Initialize all frameworks
-            )
+        # Calculate overall initialization success
+        successful_initializations = sum(1 for result in results.values() if result)
+        total_systems = len(results)
 
-            self.systems[EnterpriseSystem.FRAMEWORK_INTEGRATOR] = {
-                'enhanced_brain': enhanced_brain,
-                'integrator': integrator
-            }
-            self.system_status[EnterpriseSystem.FRAMEWORK_INTEGRATOR].initialized = True
-            self.system_status[EnterpriseSystem.FRAMEWORK_INTEGRATOR].active = True
-            results['framework_integrator'] = True
-            logger.info("✅ Framework Integrator initialized")
+        self.initialized = successful_initializations == total_systems
 
-        except Exception as e:
-            logger.error(f"❌ Framework Integrator failed: {e}")
-            results['framework_integrator'] = False
+        logger.info("Enterprise Backend initialization complete: %d/%d systems initialized",
+                    successful_initializations, total_systems)
 
-        # 2. AI Model Integration
-        try:
-            from ai_model_integration import IntelligentModelRouter, route_task, get_model_recommendations
+        return results
 
-            model_router = IntelligentModelRouter()
-            self.systems[EnterpriseSystem.AI_MODEL_INTEGRATION] = {
-                'model_router': model_router,
-                'route_task': route_task,
-                'get_recommendations': get_model_recommendations
-            }
-            self.system_status[EnterpriseSystem.AI_MODEL_INTEGRATION].initialized = True
-            self.system_status[EnterpriseSystem.AI_MODEL_INTEGRATION].active = True
-            results['ai_model_integration'] = True
-            logger.info("✅ AI Model Integration initialized")
+    async def _ensure_initialized(self, system: EnterpriseSystem, retry: bool = False) -> bool:
+        """
+        Initialize a system on first use
 
-        except Exception as e:
-            logger.error(f"❌ AI Model Integration failed: {e}")
-            results['ai_model_integration'] = False
+        Each system is attempted once; later requests for a system that
+        failed to initialize fail fast unless retry is set (as
+        initialize_all_systems does).
+        """
+        status = self.system_status[system]
+        if status.initialized:
+            return True
+        if system in self._init_attempted and not retry:
+            return False
 
-        # 3. Spec-Driven Planner
-        try:
-            from spec_driven_planner import SpecDrivenPlanner
+        lock = self._init_locks.get(system)
+        if lock is None:
+            lock = self._init_locks[system] = asyncio.Lock()
 
-            planner = SpecDrivenPlanner(str(self.workspace_dir))
-            self.systems[EnterpriseSystem.SPEC_DRIVEN_PLANNER] = {
-                'planner': planner
-            }
-            self.system_status[EnterpriseSystem.SPEC_DRIVEN_PLANNER].initialized = True
-            self.system_status[EnterpriseSystem.SPEC_DRIVEN_PLANNER].active = True
-            results['spec_driven_planner'] = True
-            logger.info("✅ Spec-Driven Planner initialized")
+        async with lock:
+            # Another request may have finished initializing while we waited
+            if not status.initialized and (retry or system not in self._init_attempted):
+                await self._initialize_system(system)
 
-        except Exception as e:
-            logger.error(f"❌ Spec-Driven Planner failed: {e}")
-            results['spec_driven_planner'] = False
+        return status.initialized
+
+    async def _initialize_system(self, system: EnterpriseSystem) -> bool:
+        """Create one system's components and mark it initialized"""
+        self._init_attempted.add(system)
+        factory = self._system_factories[system]
+        display_name = SYSTEM_DISPLAY_NAMES[system]
 
-        # 4. Testing Framework
         try:
-            from testing_framework import TestingFramework, auto_generate_tests, run_test_suite, get_test_recommendations
-
-            testing_framework = TestingFramework(str(self.workspace_dir))
-            self.systems[EnterpriseSystem.TESTING_FRAMEWORK] = {
-                'framework': testing_framework,
-                'auto_generate': auto_generate_tests,
-                'run_suite': run_test_suite,
-                'get_recommendations': get_test_recommendations
-            }
-            self.system_status[EnterpriseSystem.TESTING_FRAMEWORK].initialized = True
-            self.system_status[EnterpriseSystem.TESTING_FRAMEWORK].active = True
-            results['testing_framework'] = True
-            logger.info("✅ Testing Framework initialized")
+            if asyncio.iscoroutinefunction(factory):
+                components = await factory()
+            else:
+                # Imports and constructors are synchronous; run them in a
+                # worker thread so the systems initialize side by side
+                components = await asyncio.to_thread(factory)
+
+            self.systems[system] = components
+            self.system_status[system].initialized = True
+            self.system_status[system].active = True
+            # Lazily initialized backends become ready once every system is up
+            self.initialized = all(status.initialized for status in self.system_status.values())
+            logger.info("✅ %s initialized", display_name)
+            return True
 
         except Exception as e:
-            logger.error(f"❌ Testing Framework failed: {e}")
-            results['testing_framework'] = False
+            logger.error("❌ %s failed: %s", display_name, e)
+            return False
 
-        # 5. Code Analysis & Debugging
-        try:
-            from code_analysis_debugging import CodeAnalyzer, DebugAssistant, CodeOptimizer
+    async def _create_framework_integrator(self) -> Dict[str, Any]:
+        """1. Framework Integrator"""
+        from framework_integrator import FrameworkIntegrator, create_enhanced_brain_with_frameworks
+        # Import enhanced brain for framework integration
+        from enhanced_brain import EnhancedBrain
+        from config import get_config
 
-            analyzer = CodeAnalyzer(str(self.workspace_dir))
-            debugger = DebugAssistant()
-            optimizer = CodeOptimizer()
+        config = get_config()
+        enhanced_brain, integrator = await create_enhanced_brain_with_frameworks(
+            None, enable_frameworks=None  # Initialize all frameworks
+        )
 
-            self.systems[EnterpriseSystem.CODE_ANALYSIS_DEBUGGING] = {
-                'analyzer': analyzer,
-                'debugger': debugger,
-                'optimizer': optimizer
-            }
-            self.system_status[EnterpriseSystem.CODE_ANALYSIS_DEBUGGING].initialized = True
-            self.system_status[EnterpriseSystem.CODE_ANALYSIS_DEBUGGING].active = True
-            results['code_analysis_debugging'] = True
-            logger.info("✅ Code Analysis & Debugging initialized")
+        return {
+            'enhanced_brain': enhanced_brain,
+            'integrator': integrator
+        }
 
-        except Exception as e:
-            logger.error(f"❌ Code Analysis & Debugging failed: {e}")
-            results['code_analysis_debugging'] = False
+    def _create_ai_model_integration(self) -> Dict[str, Any]:
+        """2. AI Model Integration"""
+        from ai_model_integration import IntelligentModelRouter, route_task, get_model_recommendations
 
-        # 6. Enhanced Web Research
-        try:
-            from enhanced_web_research import WebResearchEngine, ContentExtractor, KnowledgeGraphBuilder
+        model_router = IntelligentModelRouter()
+        return {
+            'model_router': model_router,
+            'route_task': route_task,
+            'get_recommendations': get_model_recommendations
+        }
 
-            research_engine = WebResearchEngine()
-            content_extractor = ContentExtractor()
-            knowledge_builder = KnowledgeGraphBuilder()
+    def _create_spec_driven_planner(self) -> Dict[str, Any]:
+        """3. Spec-Driven Planner"""
+        from spec_driven_planner import SpecDrivenPlanner
 
-            self.systems[EnterpriseSystem.ENHANCED_WEB_RESEARCH] = {
-                'research_engine': research_engine,
-                'content_extractor': content_extractor,
-                'knowledge_builder': knowledge_builder
-            }
-            self.system_status[EnterpriseSystem.ENHANCED_WEB_RESEARCH].initialized = True
-            self.system_status[EnterpriseSystem.ENHANCED_WEB_RESEARCH].active = True
-            results['enhanced_web_research'] = True
-            logger.info("✅ Enhanced Web Research initialized")
+        planner = SpecDrivenPlanner(str(self.workspace_dir))
+        return {
+            'planner': planner
+        }
 
-        except Exception as e:
-            logger.error(f"❌ Enhanced Web Research failed: {e}")
-            results['enhanced_web_research'] = False
+    def _create_testing_framework(self) -> Dict[str, Any]:
+        """4. Testing Framework"""
+        from testing_framework import TestingFramework, auto_generate_tests, run_test_suite, get_test_recommendations
 
-        # 7. Plan Verification
-        try:
-            from plan_verification import PlanVerifier, ImplementationValidator, QualityAssuranceEngine
+        testing_framework = TestingFramework(str(self.workspace_dir))
+        return {
+            'framework': testing_framework,
+            'auto_generate': auto_generate_tests,
+            'run_suite': run_test_suite,
+            'get_recommendations': get_test_recommendations
+        }
 
-            verifier = PlanVerifier()
-            validator = ImplementationValidator()
-            qa_engine = QualityAssuranceEngine()
+    def _create_code_analysis_debugging(self) -> Dict[str, Any]:
+        """5. Code Analysis & Debugging"""
+        from code_analysis_debugging import CodeAnalyzer, DebugAssistant, CodeOptimizer
 
-            self.systems[EnterpriseSystem.PLAN_VERIFICATION] = {
-                'verifier': verifier,
-                'validator': validator,
-                'qa_engine': qa_engine
-            }
-            self.system_status[EnterpriseSystem.PLAN_VERIFICATION].initialized = True
-            self.system_status[EnterpriseSystem.PLAN_VERIFICATION].active = True
-            results['plan_verification'] = True
-            logger.info("✅ Plan Verification initialized")
+        analyzer = CodeAnalyzer(str(self.workspace_dir))
+        debugger = DebugAssistant()
+        optimizer = CodeOptimizer()
 
-        except Exception as e:
-            logger.error(f"❌ Plan Verification failed: {e}")
-            results['plan_verification'] = False
+        return {
+            'analyzer': analyzer,
+            'debugger': debugger,
+            'optimizer': optimizer
+        }
 
-        # Calculate overall initialization success
-        successful_initializations = sum(1 for result in results.values() if result)
-        total_systems = len(results)
+    def _create_enhanced_web_research(self) -> Dict[str, Any]:
+        """6. Enhanced Web Research"""
+        from enhanced_web_research import WebResearchEngine, ContentExtractor, KnowledgeGraphBuilder
 
-        self.initialized = successful_initializations == total_systems
+        research_engine = WebResearchEngine()
+        content_extractor = ContentExtractor()
+        knowledge_builder = KnowledgeGraphBuilder()
 
-        logger.info(f"Enterprise Backend initialization complete: {successful_initializations}/{total_systems} systems initialized")
+        return {
+            'research_engine': research_engine,
+            'content_extractor': content_extractor,
+            'knowledge_builder': knowledge_builder
+        }
 
-        return results
+    def _create_plan_verification(self) -> Dict[str, Any]:
+        """7. Plan Verification"""
+        from plan_verification import PlanVerifier, ImplementationValidator, QualityAssuranceEngine
+
+        verifier = PlanVerifier()
+        validator = ImplementationValidator()
+        qa_engine = QualityAssuranceEngine()
+
+        return {
+            'verifier': verifier,
+            'validator': validator,
+            'qa_engine': qa_engine
+        }
 
     async def process_request(self, request: EnterpriseRequest) -> EnterpriseResponse:
         """Process a request through the appropriate enterprise system"""
-        start_time = time.time()
-        request.request_id = request.request_id or f"req_{int(time.time() * 1000)}"
+        start_ns = time.monotonic_ns()
+        request.request_id = request.request_id or f"req_{next(_request_sequence)}"
+        status = self.system_status[request.system]
 
         # Track request
         self.request_history.append(request)
+        self._total_requests += 1
 
         try:
-            # Check if system is available
-            if not self.system_status[request.system].initialized:
+            # Check if system is available, initializing it on first use
+            if not status.initialized and not await self._ensure_initialized(request.system):
                 raise ValueError(f"System {request.system.value} is not initialized")
 
             # Update system status
-            self.system_status[request.system].last_used = time.time()
-            self.system_status[request.system].usage_count += 1
-            self.system_status[request.system].active = True
-
-            # Route to appropriate system
-            result = await self._route_to_system(request)
-
-            execution_time = time.time() - start_time
+            self._mark_used(status, time.time())
+
+            # Serve idempotent operations from the response cache
+            cache_ttl = CACHEABLE_OPERATIONS.get((request.system, request.operation))
+            cache_key = self._response_cache_key(request) if cache_ttl else None
+            cache_hit, result = self._cache_lookup(cache_key) if cache_key else (False, None)
+
+            if not cache_hit:
+                # Route to appropriate system, bounding in-flight calls per system
+                async with self._get_semaphore(request.system):
+                    try:
+                        result = await asyncio.wait_for(
+                            self._route_to_system(request), timeout=request.timeout or None
+                        )
+                    except asyncio.TimeoutError:
+                        raise TimeoutError(
+                            f"{request.system.value}.{request.operation} timed out after {request.timeout}s"
+                        )
+                if cache_key:
+                    self._cache_store(cache_key, result, cache_ttl)
+
+            execution_time = (time.monotonic_ns() - start_ns) / 1e9
 
             response = EnterpriseResponse(
                 request_id=request.request_id,
@@ -295,21 +465,20 @@ class EnterpriseBackend:
                 success=True,
                 result=result,
                 execution_time=execution_time,
-                metadata={"system_health": self.system_status[request.system].health_score}
+                health_score=status.health_score,
+                metadata=_CACHE_HIT_METADATA if cache_hit else _EMPTY_METADATA
             )
 
             # Track response
-            self.response_history.append(response)
+            self._record_response(response)
 
             return response
 
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = (time.monotonic_ns() - start_ns) / 1e9
 
             # Update error count
-            self.system_status[request.system].error_count += 1
-            self.system_status[request.system].health_score = max(0.0,
-                self.system_status[request.system].health_score - 0.1)
+            self._mark_error(status)
 
             response = EnterpriseResponse(
                 request_id=request.request_id,
@@ -319,161 +488,222 @@ class EnterpriseBackend:
                 result=None,
                 execution_time=execution_time,
                 error_message=str(e),
-                metadata={"system_health": self.system_status[request.system].health_score}
+                health_score=status.health_score,
+                metadata=_EMPTY_METADATA
             )
 
             # Track failed response
-            self.response_history.append(response)
+            self._record_response(response)
 
             return response
 
-    async def _route_to_system(self, request: EnterpriseRequest) -> Any:
-        """Route request to the appropriate enterprise system"""
-        system = self.systems[request.system]
-
-        if request.system == EnterpriseSystem.FRAMEWORK_INTEGRATOR:
-            return await self._handle_framework_integrator(request, system)
-
-        elif request.system == EnterpriseSystem.AI_MODEL_INTEGRATION:
-            return await self._handle_ai_model_integration(request, system)
-
-        elif request.system == EnterpriseSystem.SPEC_DRIVEN_PLANNER:
-            return await self._handle_spec_driven_planner(request, system)
-
-        elif request.system == EnterpriseSystem.TESTING_FRAMEWORK:
-            return await self._handle_testing_framework(request, system)
-
-        elif request.system == EnterpriseSystem.CODE_ANALYSIS_DEBUGGING:
-            return await self._handle_code_analysis_debugging(request, system)
-
-        elif request.system == EnterpriseSystem.ENHANCED_WEB_RESEARCH:
-            return await self._handle_enhanced_web_research(request, system)
-
-        elif request.system == EnterpriseSystem.PLAN_VERIFICATION:
-            return await self._handle_plan_verification(request, system)
-
-        else:
-            raise ValueError(f"Unknown system: {request.system}")
-
-    async def _handle_framework_integrator(self, request: EnterpriseRequest, system: Dict) -> Any:
-        """Handle Framework Integrator requests"""
-        integrator = system['integrator']
-
-        if request.operation == "process_message":
-            framework_type = request.parameters.get("framework", "langchain")
-            message = request.parameters.get("message", "")
-            # Map string to enum
-            from framework_integrator import FrameworkType
-            fw_type = getattr(FrameworkType, framework_type.upper(), FrameworkType.LANGCHAIN)
-            return await integrator.process_message(fw_type, message)
-
-        elif request.operation == "execute_skill":
-            framework_type = request.parameters.get("framework", "langchain")
-            skill_name = request.parameters.get("skill_name", "")
-            kwargs = request.parameters.get("kwargs", {})
-            from framework_integrator import FrameworkType
-            fw_type = getattr(FrameworkType, framework_type.upper(), FrameworkType.LANGCHAIN)
-            return await integrator.execute_skill(fw_type, skill_name, **kwargs)
-
-        else:
-            raise ValueError(f"Unknown operation: {request.operation}")
-
-    async def _handle_ai_model_integration(self, request: EnterpriseRequest, system: Dict) -> Any:
-        """Handle AI Model Integration requests"""
-        if request.operation == "route_task":
-            task_type = request.parameters.get("task_type", "")
-            prompt = request.parameters.get("prompt", "")
-            capabilities = request.parameters.get("capabilities", [])
-            priority = request.parameters.get("priority", "medium")
-            return await system['route_task'](task_type, prompt, capabilities, priority)
-
-        elif request.operation == "get_recommendations":
-            task_description = request.parameters.get("task_description", "")
-            return system['get_recommendations'](task_description)
-
-        else:
-            raise ValueError(f"Unknown operation: {request.operation}")
-
-    async def _handle_spec_driven_planner(self, request: EnterpriseRequest, system: Dict) -> Any:
-        """Handle Spec-Driven Planner requests"""
-        planner = system['planner']
+    @staticmethod
+    def _mark_used(status: EnterpriseSystemStatus, now: float) -> None:
+        """Record a request against a system"""
+        status.last_used = now
+        status.usage_count += 1
+        status.active = True
+
+    @staticmethod
+    def _mark_error(status: EnterpriseSystemStatus) -> None:
+        """Record a failure against a system and lower its health score"""
+        status.error_count += 1
+        health_score = status.health_score - 0.1
+        status.health_score = health_score if health_score > 0.0 else 0.0
+
+    def _get_semaphore(self, system: EnterpriseSystem) -> asyncio.Semaphore:
+        """Get the concurrency limit for a system, creating it on first use"""
+        semaphore = self._semaphores.get(system)
+        if semaphore is None:
+            limit = 1 if system in SERIALIZED_SYSTEMS else self.max_concurrency_per_system
+            semaphore = asyncio.Semaphore(limit)
+            self._semaphores[system] = semaphore
+        return semaphore
+
+    def _response_cache_key(self, request: EnterpriseRequest) -> Optional[str]:
+        """Hash a request's system, operation and parameters into a cache key"""
+        payload = {"s": request.system.value, "o": request.operation, "p": request.parameters}
+
+        path_param = FILE_KEYED_OPERATIONS.get((request.system, request.operation))
+        if path_param is not None:
+            try:
+                stat = os.stat(request.parameters.get(path_param, ""))
+            except (OSError, TypeError, ValueError):
+                # Missing or unreadable files are not cached
+                return None
+            payload["f"] = (stat.st_mtime_ns, stat.st_size)
 
-        if request.operation == "create_plan":
-            requirements = request.parameters.get("requirements", "")
-            return await planner.create_implementation_plan(requirements)
-
-        else:
-            raise ValueError(f"Unknown operation: {request.operation}")
-
-    async def _handle_testing_framework(self, request: EnterpriseRequest, system: Dict) -> Any:
-        """Handle Testing Framework requests"""
-        if request.operation == "auto_generate_tests":
-            source_file = request.parameters.get("source_file", "")
-            test_type = request.parameters.get("test_type", "unit")
-            return await system['auto_generate'](source_file, test_type)
-
-        elif request.operation == "run_test_suite":
-            test_directory = request.parameters.get("test_directory")
-            return await system['run_suite'](test_directory)
-
-        elif request.operation == "get_recommendations":
-            file_path = request.parameters.get("file_path", "")
-            return system['get_recommendations'](file_path)
-
-        else:
-            raise ValueError(f"Unknown operation: {request.operation}")
-
-    async def _handle_code_analysis_debugging(self, request: EnterpriseRequest, system: Dict) -> Any:
-        """Handle Code Analysis & Debugging requests"""
-        if request.operation == "analyze_code":
-            file_path = request.parameters.get("file_path", "")
-            return system['analyzer'].analyze_file(file_path)
-
-        elif request.operation == "debug_code":
-            code = request.parameters.get("code", "")
-            error = request.parameters.get("error", "")
-            return system['debugger'].analyze_error(code, error)
-
-        elif request.operation == "optimize_code":
-            code = request.parameters.get("code", "")
-            return system['optimizer'].optimize(code)
-
-        else:
-            raise ValueError(f"Unknown operation: {request.operation}")
-
-    async def _handle_enhanced_web_research(self, request: EnterpriseRequest, system: Dict) -> Any:
-        """Handle Enhanced Web Research requests"""
-        if request.operation == "research_topic":
-            topic = request.parameters.get("topic", "")
-            return await system['research_engine'].research(topic)
-
-        elif request.operation == "extract_content":
-            url = request.parameters.get("url", "")
-            return system['content_extractor'].extract(url)
-
-        elif request.operation == "build_knowledge_graph":
-            data = request.parameters.get("data", [])
-            return system['knowledge_builder'].build_graph(data)
+        try:
+            encoded = _dumps_sorted(payload)
+        except (TypeError, ValueError):
+            # Parameters that cannot be serialized are simply not cached
+            return None
+        return hashlib.sha256(encoded).hexdigest()
+
+    def _cache_lookup(self, key: str) -> Tuple[bool, Any]:
+        """Return (hit, result) for a cache key, dropping expired entries"""
+        entry = self._response_cache.get(key)
+        if entry is None:
+            return False, None
+
+        expires_at, result = entry
+        if expires_at < time.monotonic():
+            del self._response_cache[key]
+            return False, None
+
+        self._response_cache.move_to_end(key)
+        # Hand each caller its own copy so mutating a response cannot
+        # change what later hits see
+        return True, copy.deepcopy(result)
+
+    def _cache_store(self, key: str, result: Any, ttl: float) -> None:
+        """Cache a copy of a result, evicting the least recently used entry when full"""
+        # Engines may return their own live state (CodeAnalyzer returns its
+        # issues list), so snapshot the result rather than keep a reference
+        try:
+            result = copy.deepcopy(result)
+        except (TypeError, copy.Error):
+            return
+        self._response_cache[key] = (time.monotonic() + ttl, result)
+        self._response_cache.move_to_end(key)
+        if len(self._response_cache) > RESPONSE_CACHE_SIZE:
+            self._response_cache.popitem(last=False)
+
+    def _record_response(self, response: EnterpriseResponse) -> None:
+        """Append a response to the history and update running totals"""
+        self.response_history.append(response)
+
+        self._total_responses += 1
+        self._total_execution_time += response.execution_time
+        stats = self._per_system_stats[response.system]
+        stats[0] += 1
+        stats[2] += response.execution_time
+        if response.success:
+            self._successful_responses += 1
+            stats[1] += 1
 
-        else:
+    async def _route_to_system(self, request: EnterpriseRequest) -> Any:
+        """Route request to the appropriate enterprise system"""
+        handler = self._operation_handlers.get((request.system, request.operation))
+        if handler is None:
             raise ValueError(f"Unknown operation: {request.operation}")
 
-    async def _handle_plan_verification(self, request: EnterpriseRequest, system: Dict) -> Any:
-        """Handle Plan Verification requests"""
-        if request.operation == "verify_plan":
-            plan = request.parameters.get("plan", {})
-            return system['verifier'].verify(plan)
-
-        elif request.operation == "validate_implementation":
-            implementation = request.parameters.get("implementation", {})
-            return system['validator'].validate(implementation)
-
-        elif request.operation == "run_quality_assurance":
-            code = request.parameters.get("code", "")
-            return system['qa_engine'].assess_quality(code)
-
-        else:
-            raise ValueError(f"Unknown operation: {request.operation}")
+        return await handler(self.systems[request.system], request.parameters)
+
+    # Framework Integrator operations
+
+    async def _framework_process_message(self, system: Dict, params: Dict[str, Any]) -> Any:
+        """Send a message through a framework adapter"""
+        framework_type = params.get("framework", "langchain")
+        message = params.get("message", "")
+        fw_type = _resolve_framework_type(framework_type)
+        return await system['integrator'].process_message(fw_type, message)
+
+    async def _framework_execute_skill(self, system: Dict, params: Dict[str, Any]) -> Any:
+        """Execute a skill through a framework adapter"""
+        framework_type = params.get("framework", "langchain")
+        skill_name = params.get("skill_name", "")
+        kwargs = params.get("kwargs", {})
+        fw_type = _resolve_framework_type(framework_type)
+        return await system['integrator'].execute_skill(fw_type, skill_name, **kwargs)
+
+    # AI Model Integration operations
+
+    async def _models_route_task(self, system: Dict, params: Dict[str, Any]) -> Any:
+        """Route a task to the best-suited model"""
+        task_type = params.get("task_type", "")
+        prompt = params.get("prompt", "")
+        capabilities = params.get("capabilities", [])
+        priority = params.get("priority", "medium")
+        return await system['route_task'](task_type, prompt, capabilities, priority)
+
+    async def _models_get_recommendations(self, system: Dict, params: Dict[str, Any]) -> Any:
+        """Get model recommendations for a task"""
+        task_description = params.get("task_description", "")
+        return system['get_recommendations'](task_description)
+
+    # Spec-Driven Planner operations
+
+    async def _planner_create_plan(self, system: Dict, params: Dict[str, Any]) -> Any:
+        """Create an implementation plan from requirements"""
+        requirements = params.get("requirements", "")
+        return await system['planner'].create_implementation_plan(requirements)
+
+    # Testing Framework operations
+
+    async def _testing_auto_generate_tests(self, system: Dict, params: Dict[str, Any]) -> Any:
+        """Generate tests for a source file"""
+        source_file = params.get("source_file", "")
+        test_type = params.get("test_type", "unit")
+        return await system['auto_generate'](source_file, test_type)
+
+    async def _testing_run_test_suite(self, system: Dict, params: Dict[str, Any]) -> Any:
+        """Run a test suite"""
+        test_directory = params.get("test_directory")
+        return await system['run_suite'](test_directory)
+
+    async def _testing_get_recommendations(self, system: Dict, params: Dict[str, Any]) -> Any:
+        """Get testing recommendations for a file"""
+        file_path = params.get("file_path", "")
+        return system['get_recommendations'](file_path)
+
+    # Code Analysis & Debugging operations
+    # (analysis and verification engines are synchronous and may parse files
+    # or walk ASTs, so they run in the default executor to keep the loop free;
+    # SERIALIZED_SYSTEMS keeps concurrent requests off their shared engines)
+
+    async def _analysis_analyze_code(self, system: Dict, params: Dict[str, Any]) -> Any:
+        """Analyze a source file"""
+        file_path = params.get("file_path", "")
+        analyzer = system['analyzer']
+        # analyze_file returns the analyzer's own issues list; copy it before
+        # the next request can touch it
+        return await asyncio.to_thread(lambda: list(analyzer.analyze_file(file_path)))
+
+    async def _analysis_debug_code(self, system: Dict, params: Dict[str, Any]) -> Any:
+        """Analyze an error in a code snippet"""
+        code = params.get("code", "")
+        error = params.get("error", "")
+        return await asyncio.to_thread(system['debugger'].analyze_error, code, error)
+
+    async def _analysis_optimize_code(self, system: Dict, params: Dict[str, Any]) -> Any:
+        """Suggest optimizations for a code snippet"""
+        code = params.get("code", "")
+        return await asyncio.to_thread(system['optimizer'].optimize, code)
+
+    # Enhanced Web Research operations
+
+    async def _research_research_topic(self, system: Dict, params: Dict[str, Any]) -> Any:
+        """Research a topic on the web"""
+        topic = params.get("topic", "")
+        return await system['research_engine'].research(topic)
+
+    async def _research_extract_content(self, system: Dict, params: Dict[str, Any]) -> Any:
+        """Extract content from a URL"""
+        url = params.get("url", "")
+        return system['content_extractor'].extract(url)
+
+    async def _research_build_knowledge_graph(self, system: Dict, params: Dict[str, Any]) -> Any:
+        """Build a knowledge graph from research data"""
+        data = params.get("data", [])
+        return system['knowledge_builder'].build_graph(data)
+
+    # Plan Verification operations
+
+    async def _verification_verify_plan(self, system: Dict, params: Dict[str, Any]) -> Any:
+        """Verify an implementation plan"""
+        plan = params.get("plan", {})
+        return await asyncio.to_thread(system['verifier'].verify, plan)
+
+    async def _verification_validate_implementation(self, system: Dict, params: Dict[str, Any]) -> Any:
+        """Validate an implementation"""
+        implementation = params.get("implementation", {})
+        return await asyncio.to_thread(system['validator'].validate, implementation)
+
+    async def _verification_run_quality_assurance(self, system: Dict, params: Dict[str, Any]) -> Any:
+        """Run quality assurance on code"""
+        code = params.get("code", "")
+        return await asyncio.to_thread(system['qa_engine'].assess_quality, code)
 
     def get_system_status(self) -> Dict[str, Any]:
         """Get comprehensive system status"""
@@ -481,9 +711,9 @@ class EnterpriseBackend:
             "initialized": self.initialized,
             "systems": {},
             "overall_health": 0.0,
-            "total_requests": len(self.request_history),
-            "successful_requests": len([r for r in self.response_history if r.success]),
-            "failed_requests": len([r for r in self.response_history if not r.success])
+            "total_requests": self._total_requests,
+            "successful_requests": self._successful_responses,
+            "failed_requests": self._total_responses - self._successful_responses
         }
 
         total_health = 0.0
@@ -513,31 +743,27 @@ class EnterpriseBackend:
     def get_performance_metrics(self) -> Dict[str, Any]:
         """Get performance metrics across all systems"""
         metrics = {
-            "total_requests": len(self.request_history),
-            "total_responses": len(self.response_history),
+            "total_requests": self._total_requests,
+            "total_responses": self._total_responses,
             "system_metrics": {},
             "average_response_time": 0.0,
             "success_rate": 0.0
         }
 
-        if self.response_history:
-            total_time = sum(r.execution_time for r in self.response_history)
-            metrics["average_response_time"] = total_time / len(self.response_history)
-            successful_responses = sum(1 for r in self.response_history if r.success)
-            metrics["success_rate"] = successful_responses / len(self.response_history)
+        if self._total_responses:
+            metrics["average_response_time"] = self._total_execution_time / self._total_responses
+            metrics["success_rate"] = self._successful_responses / self._total_responses
 
         # System-specific metrics
-        for system in EnterpriseSystem:
-            system_responses = [r for r in self.response_history if r.system == system]
-            if system_responses:
-                system_metrics = {
-                    "requests": len(system_responses),
-                    "successful": sum(1 for r in system_responses if r.success),
-                    "failed": sum(1 for r in system_responses if not r.success),
-                    "average_time": sum(r.execution_time for r in system_responses) / len(system_responses),
-                    "success_rate": sum(1 for r in system_responses if r.success) / len(system_responses)
+        for system, (requests, successful, total_time) in self._per_system_stats.items():
+            if requests:
+                metrics["system_metrics"][system.value] = {
+                    "requests": requests,
+                    "successful": successful,
+                    "failed": requests - successful,
+                    "average_time": total_time / requests,
+                    "success_rate": successful / requests
                 }
-                metrics["system_metrics"][system.value] = system_metrics
 
         return metrics
 
@@ -559,15 +785,21 @@ class EnterpriseBackend:
             return True
 
         except Exception as e:
-            logger.error(f"Error during Enterprise Backend shutdown: {e}")
+            logger.error("Error during Enterprise Backend shutdown: %s", e)
             return False
 
 # Convenience functions for easy integration
 
-async def initialize_enterprise_backend(workspace_dir: str = ".") -> EnterpriseBackend:
-    """Initialize the complete enterprise backend"""
+async def initialize_enterprise_backend(workspace_dir: str = ".", lazy: bool = False) -> EnterpriseBackend:
+    """
+    Initialize the complete enterprise backend
+
+    With lazy=True no system is set up front; each one is imported and
+    constructed the first time a request targets it.
+    """
     backend = EnterpriseBackend(workspace_dir)
-    await backend.initialize_all_systems()
+    if not lazy:
+        await backend.initialize_all_systems()
     return backend
 
 async def process_enterprise_request(
@@ -579,7 +811,7 @@ async def process_enterprise_request(
 ) -> EnterpriseResponse:
     """Process a request through the enterprise backend"""
     # Convert string to enum
-    system_enum = getattr(EnterpriseSystem, system.upper(), None)
+    system_enum = _SYSTEM_BY_NAME.get(system) or _SYSTEM_BY_NAME.get(system.lower())
     if not system_enum:
         raise ValueError(f"Unknown system: {system}")
 
@@ -663,4 +895,7 @@ async def demo_enterprise_backend():
     print("\n🔄 Enterprise Backend demo complete!")
 
 if __name__ == "__main__":
-    asyncio.run(demo_enterprise_backend())
+    if UVLOOP_AVAILABLE:
+        uvloop.run(demo_enterprise_backend())
+    else:
+        asyncio.run(demo_enterprise_backend())
@@ -50,6 +50,14 @@ class IntegrationMode(Enum):
     HYBRID = "hybrid"          # Combine multiple approaches
 
 
+# Default integration mode for each supported framework
+DEFAULT_INTEGRATION_MODES: Dict[FrameworkType, IntegrationMode] = {
+    FrameworkType.LANGCHAIN: IntegrationMode.ADAPTER,
+    FrameworkType.CREWAI: IntegrationMode.BRIDGE,
+    FrameworkType.AUTOGEN: IntegrationMode.HYBRID,
+}
+
+
 @dataclass
 class FrameworkIntegrationConfig:
     """Configuration for framework integration"""
@@ -769,6 +777,14 @@ class AutoGenAdapter(MiniMaxFrameworkAdapter):
         )
 
 
+# Adapter implementation for each supported framework
+ADAPTER_CLASSES: Dict[FrameworkType, Type[MiniMaxFrameworkAdapter]] = {
+    FrameworkType.LANGCHAIN: LangChainAdapter,
+    FrameworkType.CREWAI: CrewAIAdapter,
+    FrameworkType.AUTOGEN: AutoGenAdapter,
+}
+
+
 class FrameworkIntegrator:
     """Main framework integration orchestrator"""
     
@@ -791,14 +807,10 @@ class FrameworkIntegrator:
                     return False
                     
                 # Create appropriate adapter
-                if framework_type == FrameworkType.LANGCHAIN:
-                    adapter = LangChainAdapter(self.enhanced_brain, config)
-                elif framework_type == FrameworkType.CREWAI:
-                    adapter = CrewAIAdapter(self.enhanced_brain, config)
-                elif framework_type == FrameworkType.AUTOGEN:
-                    adapter = AutoGenAdapter(self.enhanced_brain, config)
-                else:
+                adapter_class = ADAPTER_CLASSES.get(framework_type)
+                if adapter_class is None:
                     raise ValueError(f"Unsupported framework type: {framework_type}")
+                adapter = adapter_class(self.enhanced_brain, config)
                     
                 # Initialize adapter
                 if await adapter.initialize():
@@ -912,29 +924,14 @@ class FrameworkIntegrator:
         """Initialize all supported frameworks with default configurations"""
         results = {}
         
-        # Default configurations for each framework
-        default_configs = {
-            FrameworkType.LANGCHAIN: FrameworkIntegrationConfig(
-                framework_type=FrameworkType.LANGCHAIN,
-                integration_mode=IntegrationMode.ADAPTER,
-                enable_fallback=True,
-                enable_metrics=True
-            ),
-            FrameworkType.CREWAI: FrameworkIntegrationConfig(
-                framework_type=FrameworkType.CREWAI,
-                integration_mode=IntegrationMode.BRIDGE,
-                enable_fallback=True,
-                enable_metrics=True
-            ),
-            FrameworkType.AUTOGEN: FrameworkIntegrationConfig(
-                framework_type=FrameworkType.AUTOGEN,
-                integration_mode=IntegrationMode.HYBRID,
+        for framework_type, integration_mode in DEFAULT_INTEGRATION_MODES.items():
+            # Each adapter gets its own config instance since configs are mutable
+            config = FrameworkIntegrationConfig(
+                framework_type=framework_type,
+                integration_mode=integration_mode,
                 enable_fallback=True,
                 enable_metrics=True
             )
-        }
-        
-        for framework_type, config in default_configs.items():
             results[framework_type] = await self.add_framework_adapter(framework_type, config)
             
         return results
@@ -32,6 +32,10 @@ class MemoryEntry:
     skill_used: Optional[str] = None
     metadata: Optional[Dict[str, Any]] = None
 
+# Field sets used to validate stored conversation entries on load
+MEMORY_ENTRY_FIELDS = frozenset(field.name for field in fields(MemoryEntry))
+REQUIRED_MEMORY_FIELDS = frozenset(('timestamp', 'session_id', 'user_message', 'assistant_response'))
+
 @dataclass
 class UserPreferences:
     theme: str = "light"  # light, dark, auto
@@ -134,12 +138,10 @@ class PersistentMemory:
                                 normalized_entry[mapped_key] = v
 
                             # Filter out unknown fields to handle schema changes gracefully
-                            valid_fields = {field.name for field in fields(MemoryEntry)}
-                            filtered_entry = {k: v for k, v in normalized_entry.items() if k in valid_fields}
+                            filtered_entry = {k: v for k, v in normalized_entry.items() if k in MEMORY_ENTRY_FIELDS}
 
                             # Ensure required fields are present
-                            required_fields = ['timestamp', 'session_id', 'user_message', 'assistant_response']
-                            if not all(field in filtered_entry for field in required_fields):
+                            if not REQUIRED_MEMORY_FIELDS <= filtered_entry.keys():
                                 logger.warning(f"Skipping entry missing required fields: {list(filtered_entry.keys())}")
                                 continue
 
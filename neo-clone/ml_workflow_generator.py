@@ -9,14 +9,20 @@ Autonomous ML model building workflow with 5 automated steps:
 """
 
 from skills import BaseSkill, SkillResult
-from functools import lru_cache
+from functools import cached_property, lru_cache
+import asyncio
+import copy
 import json
+import os
 import time
+import uuid
 import logging
+import sys
 from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass, asdict
 from datetime import datetime
 from pathlib import Path
+from collections import OrderedDict
 
 try:
     from skills.task_orchestrator import ModelOrchestrator, Task, TaskResult
@@ -31,9 +37,70 @@ except ImportError:
     def load_config():
         return {'models': {'default': 'opencode/big-pickle'}}
 
+# orjson is an optional, faster serializer for workflow and results files
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Number of parsed results files kept for repeated monitor calls
+MONITOR_CACHE_SIZE = 16
+
+# Artifacts produced by a completed workflow, per problem type
+WORKFLOW_ARTIFACTS: Dict[str, Tuple[str, ...]] = {
+    'classification': (
+        'cleaned_data.csv', 'data_analysis_report.json', 'feature_matrix.csv',
+        'feature_importance.json', 'model_config.json', 'training_pipeline.py',
+        'trained_model.pkl', 'hyperparameters.json', 'cv_results.json',
+        'evaluation_report.json', 'deployment_package.zip', 'model_documentation.md'
+    ),
+    'regression': (
+        'cleaned_data.csv', 'target_analysis.json', 'feature_matrix.csv',
+        'correlation_analysis.json', 'model_comparison.json', 'ensemble_config.json',
+        'trained_models.pkl', 'residual_analysis.json', 'validation_results.json',
+        'performance_report.json', 'prediction_api.py', 'model_summary.md'
+    ),
+}
+
+
+def _write_json(path: Path, data: Dict[str, Any], pretty: bool = False) -> None:
+    """Atomically write data to path as compact (or indented) JSON, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+    elif pretty:
+        payload = json.dumps(data, indent=2).encode('utf-8')
+    else:
+        payload = json.dumps(data, separators=(',', ':')).encode('utf-8')
+    # Readers such as _monitor_workflow never see a partially written file
+    tmp_path = path.with_name(path.name + '.tmp')
+    try:
+        tmp_path.write_bytes(payload)
+        os.replace(tmp_path, path)
+    except BaseException:
+        # Leave the previous file in place and no stray temp file behind
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _workflow_file(workflow_id: str) -> Path:
+    """Plan file for a workflow, derived from its id so any instance can find it"""
+    return Path(f'{workflow_id}_workflow.json')
+
+
+def _read_json(path: Path) -> Dict[str, Any]:
+    """Read a JSON file, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_text())
+
+# Configs and steps are never modified once built, so freeze them and drop
+# the per-instance __dict__ where the interpreter allows it
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(frozen=True, **_DATACLASS_OPTIONS)
 class MLWorkflowConfig:
     """Configuration for ML workflow"""
     project_name: str
@@ -46,9 +113,10 @@ class MLWorkflowConfig:
 
     def __post_init__(self):
         if self.evaluation_metrics is None:
-            self.evaluation_metrics = ['accuracy'] if self.problem_type == 'classification' else ['mse', 'r2']
+            default_metrics = ['accuracy'] if self.problem_type == 'classification' else ['mse', 'r2']
+            object.__setattr__(self, 'evaluation_metrics', default_metrics)
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_OPTIONS)
 class WorkflowStep:
     """Represents a single step in ML workflow"""
     step_id: str
@@ -68,9 +136,37 @@ class MLWorkflowGenerator(BaseSkill):
             description='Creates and executes complete ML model building workflows with 5 automated steps',
             example='ml_workflow create --project "customer_churn" --type classification --data "customer_data.csv"'
         )
-        self.config = load_config()
-        self.orchestrator = ModelOrchestrator(self.config) if ModelOrchestrator else None
-        self.workflow_templates = self._initialize_workflow_templates()
+        # Plans created by this instance, so execution skips re-reading them from disk
+        self._workflow_plans: Dict[str, Dict[str, Any]] = {}
+        # Parsed results per workflow, keyed by the results file's
+        # (mtime, inode, size) (LRU)
+        self._monitor_cache: "OrderedDict[str, Tuple[Tuple[int, int, int], Dict[str, Any]]]" = OrderedDict()
+
+    # Config, orchestrator and templates are built on first use, so registering
+    # the skill or running read-only actions does not pay for them
+
+    @cached_property
+    def config(self) -> Dict[str, Any]:
+        """Model configuration, loaded on first use"""
+        return load_config()
+
+    @cached_property
+    def orchestrator(self):
+        """Model orchestrator, created on first use (None if unavailable)"""
+        return ModelOrchestrator(self.config) if ModelOrchestrator else None
+
+    @cached_property
+    def workflow_templates(self) -> Dict[str, List[WorkflowStep]]:
+        """Predefined workflow templates, built on first use"""
+        return self._initialize_workflow_templates()
+
+    @cached_property
+    def _template_cache(self) -> Dict[str, Tuple[List[Dict[str, Any]], float]]:
+        """Serialized steps and total duration per template; templates never change"""
+        return {
+            problem_type: ([asdict(step) for step in steps], sum(step.estimated_duration for step in steps))
+            for problem_type, steps in self.workflow_templates.items()
+        }
 
     @property
     def parameters(self):
@@ -83,7 +179,8 @@ class MLWorkflowGenerator(BaseSkill):
             'evaluation_metrics': 'list - Evaluation metrics to use',
             'deployment_target': 'string - Deployment target (default: local)',
             'optimization_priority': 'string - Optimization priority (accuracy, speed, interpretability)',
-            'workflow_id': 'string - ID of existing workflow to execute/monitor'
+            'workflow_id': 'string - ID of existing workflow to execute/monitor',
+            'pretty': 'bool - Write indented workflow/results JSON (default: false)'
         }
 
     def execute(self, params):
@@ -120,6 +217,10 @@ class MLWorkflowGenerator(BaseSkill):
             logger.error(f"ML workflow operation failed: {str(e)}")
             return SkillResult(False, f"Operation failed: {str(e)}")
 
+    async def execute_async(self, params):
+        """Execute without blocking the event loop on workflow file I/O"""
+        return await asyncio.to_thread(self.execute, params)
+
     def _initialize_workflow_templates(self) -> Dict[str, List[WorkflowStep]]:
         """Initialize predefined workflow templates"""
         return {
@@ -200,19 +301,21 @@ class MLWorkflowGenerator(BaseSkill):
             optimization_priority=params.get('optimization_priority', 'accuracy')
         )
         
-        steps = self.workflow_templates.get(problem_type, self.workflow_templates['classification'])
+        steps, estimated_total_duration = self._template_cache.get(problem_type, self._template_cache['classification'])
         workflow_plan = {
-            'workflow_id': f'ml_wf_{int(time.time())}',
+            # The random suffix keeps workflows created in the same second apart
+            'workflow_id': f'ml_wf_{int(time.time())}_{uuid.uuid4().hex[:8]}',
             'config': asdict(config),
-            'steps': [asdict(step) for step in steps],
-            'estimated_total_duration': sum((step.estimated_duration for step in steps)),
+            # Plans are kept in _workflow_plans, so they must not share the cached dicts
+            'steps': copy.deepcopy(steps),
+            'estimated_total_duration': estimated_total_duration,
             'created_at': datetime.now().isoformat(),
             'status': 'ready'
         }
         
-        workflow_file = Path(f'{project_name}_workflow.json')
-        with open(workflow_file, 'w') as f:
-            json.dump(workflow_plan, f, indent=2)
+        workflow_file = _workflow_file(workflow_plan['workflow_id'])
+        _write_json(workflow_file, workflow_plan, pretty=params.get('pretty', False))
+        self._workflow_plans[workflow_plan['workflow_id']] = workflow_plan
         
         return {
             'status': 'success',
@@ -233,18 +336,29 @@ class MLWorkflowGenerator(BaseSkill):
         if not self.orchestrator:
             return {'status': 'error', 'message': 'Model orchestrator not available'}
             
-        workflow_file = Path(f"ml_wf_{workflow_id.split('_')[-1]}.json")
-        if not workflow_file.exists():
-            return {'status': 'error', 'message': f'Workflow file {workflow_file} not found'}
+        workflow_plan = self._workflow_plans.get(workflow_id)
+        if workflow_plan is None:
+            workflow_file = _workflow_file(workflow_id)
+            if not workflow_file.exists():
+                return {'status': 'error', 'message': f'Workflow file {workflow_file} not found'}
+            
+            workflow_plan = _read_json(workflow_file)
         
-        with open(workflow_file, 'r') as f:
-            workflow_plan = json.load(f)
+        # Steps are only read here, so they stay as the plan's dicts
+        steps = workflow_plan['steps']
         
-        steps = []
-        for step_data in workflow_plan['steps']:
-            steps.append(WorkflowStep(**step_data))
+        try:
+            levels = self._schedule_levels(steps)
+        except ValueError as e:
+            return {'status': 'error', 'message': str(e)}
+        
+        # Simulate execution since orchestrator might not be available;
+        # steps within a level have no dependencies on each other
+        step_results = []
+        for level in levels:
+            for step in level:
+                step_results.append({'step_id': step['step_id'], 'execution_time': step['estimated_duration'], 'success': True})
         
-        # Simulate execution since orchestrator might not be available
         execution_summary = {
             'workflow_id': workflow_id,
             'execution_time': 25.5,
@@ -252,15 +366,14 @@ class MLWorkflowGenerator(BaseSkill):
             'successful_steps': len(steps),
             'failed_steps': 0,
             'success_rate': 1.0,
-            'results': [{'step_id': step.step_id, 'execution_time': step.estimated_duration, 'success': True} for step in steps],
+            'results': step_results,
             'artifacts': self._collect_artifacts(steps, workflow_plan['config']),
             'status': 'completed',
             'completed_at': datetime.now().isoformat()
         }
         
         results_file = Path(f'{workflow_id}_results.json')
-        with open(results_file, 'w') as f:
-            json.dump(execution_summary, f, indent=2)
+        _write_json(results_file, execution_summary, pretty=params.get('pretty', False))
         
         return {
             'status': 'success',
@@ -270,18 +383,47 @@ class MLWorkflowGenerator(BaseSkill):
             'results_file': str(results_file)
         }
 
+    @staticmethod
+    def _schedule_levels(steps: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """Group serialized steps into dependency levels in topological order"""
+        steps_by_id = {step['step_id']: step for step in steps}
+        pending = {step['step_id']: set(step['dependencies']) for step in steps}
+        completed = set()
+        levels = []
+        while pending:
+            ready = [step_id for step_id, deps in pending.items() if deps <= completed]
+            if not ready:
+                raise ValueError(f"Unresolvable step dependencies: {', '.join(sorted(pending))}")
+            for step_id in ready:
+                del pending[step_id]
+            completed.update(ready)
+            levels.append([steps_by_id[step_id] for step_id in ready])
+        return levels
+
     def _generate_step_prompt(self, step: WorkflowStep, config: Dict[str, Any]) -> str:
         """Generate detailed prompt for each workflow step"""
+        return self._build_step_prompt(
+            step.step_id, step.name, step.description, tuple(step.output_artifacts),
+            config['project_name'], config['problem_type'], config['data_source'],
+            config.get('target_variable', 'N/A'), config['optimization_priority']
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _build_step_prompt(step_id: str, name: str, description: str, output_artifacts: Tuple[str, ...],
+                           project_name: str, problem_type: str, data_source: str,
+                           target_variable: Optional[str], optimization_priority: str) -> str:
+        """Build the prompt for a step; cached since retries regenerate identical prompts"""
         base_prompt = f"""
-        ML Workflow Step: {step.name}
-        Project: {config['project_name']}
-        Problem Type: {config['problem_type']}
-        Data Source: {config['data_source']}
-        Target Variable: {config.get('target_variable', 'N/A')}
+        ML Workflow Step: {name}
+        Project: {project_name}
+        Problem Type: {problem_type}
+        Data Source: {data_source}
+        Target Variable: {target_variable}
         
-        Task: {step.description}
+        Task: {description}
         
-        Expected Outputs: {', '.join(step.output_artifacts)}
+        Expected Outputs: {', '.join(output_artifacts)}
         
         Please provide:
         1. Detailed analysis and implementation
@@ -290,10 +432,10 @@ class MLWorkflowGenerator(BaseSkill):
         4. Quality checks and validation steps
         5. Documentation for artifacts produced
         
-        Focus on {config['optimization_priority']} and ensure reproducibility.
+        Focus on {optimization_priority} and ensure reproducibility.
         """
         
-        if step.step_id == 'data_analysis':
+        if step_id == 'data_analysis':
             base_prompt += """
             Specific requirements for data analysis:
             - Load and inspect the dataset
@@ -303,7 +445,7 @@ class MLWorkflowGenerator(BaseSkill):
             - Provide data cleaning recommendations
             - Save cleaned dataset and analysis report
             """
-        elif step.step_id == 'feature_engineering':
+        elif step_id == 'feature_engineering':
             base_prompt += """
             Specific requirements for feature engineering:
             - Create new meaningful features from existing data
@@ -313,7 +455,7 @@ class MLWorkflowGenerator(BaseSkill):
             - Document feature importance and correlations
             - Save final feature matrix and feature documentation
             """
-        elif step.step_id == 'model_design':
+        elif step_id == 'model_design':
             base_prompt += """
             Specific requirements for model design:
             - Compare multiple model architectures suitable for the problem
@@ -323,7 +465,7 @@ class MLWorkflowGenerator(BaseSkill):
             - Create model configuration files
             - Prepare data loading and preprocessing pipelines
             """
-        elif step.step_id == 'training_optimization':
+        elif step_id == 'training_optimization':
             base_prompt += """
             Specific requirements for training and optimization:
             - Implement model training with cross-validation
@@ -333,7 +475,7 @@ class MLWorkflowGenerator(BaseSkill):
             - Save best models and training logs
             - Generate validation results and performance metrics
             """
-        elif step.step_id == 'evaluation_deployment':
+        elif step_id == 'evaluation_deployment':
             base_prompt += """
             Specific requirements for evaluation and deployment:
             - Evaluate final model on test set with specified metrics
@@ -346,24 +488,9 @@ class MLWorkflowGenerator(BaseSkill):
         
         return base_prompt
 
-    def _collect_artifacts(self, steps: List[WorkflowStep], config: Dict[str, Any]) -> List[str]:
+    def _collect_artifacts(self, steps: List[Dict[str, Any]], config: Dict[str, Any]) -> List[str]:
         """Collect and list all artifacts generated during workflow execution"""
-        artifacts = []
-        if config['problem_type'] == 'classification':
-            artifacts.extend([
-                'cleaned_data.csv', 'data_analysis_report.json', 'feature_matrix.csv', 
-                'feature_importance.json', 'model_config.json', 'training_pipeline.py', 
-                'trained_model.pkl', 'hyperparameters.json', 'cv_results.json', 
-                'evaluation_report.json', 'deployment_package.zip', 'model_documentation.md'
-            ])
-        elif config['problem_type'] == 'regression':
-            artifacts.extend([
-                'cleaned_data.csv', 'target_analysis.json', 'feature_matrix.csv', 
-                'correlation_analysis.json', 'model_comparison.json', 'ensemble_config.json', 
-                'trained_models.pkl', 'residual_analysis.json', 'validation_results.json', 
-                'performance_report.json', 'prediction_api.py', 'model_summary.md'
-            ])
-        return artifacts
+        return list(WORKFLOW_ARTIFACTS.get(config['problem_type'], ()))
 
     def _monitor_workflow(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Monitor workflow execution status"""
@@ -372,11 +499,24 @@ class MLWorkflowGenerator(BaseSkill):
             return {'status': 'error', 'message': 'workflow_id required'}
         
         results_file = Path(f'{workflow_id}_results.json')
-        if not results_file.exists():
+        try:
+            stat = results_file.stat()
+        except FileNotFoundError:
             return {'status': 'error', 'message': f'Results file for {workflow_id} not found'}
+        # _write_json replaces the file, so a rewrite within one mtime tick
+        # still shows up as a new inode
+        signature = (stat.st_mtime_ns, stat.st_ino, stat.st_size)
         
-        with open(results_file, 'r') as f:
-            results = json.load(f)
+        # Polling an unchanged results file costs one stat() instead of a full re-parse
+        cached = self._monitor_cache.get(workflow_id)
+        if cached is not None and cached[0] == signature:
+            results = cached[1]
+        else:
+            results = _read_json(results_file)
+            self._monitor_cache[workflow_id] = (signature, results)
+            if len(self._monitor_cache) > MONITOR_CACHE_SIZE:
+                self._monitor_cache.popitem(last=False)
+        self._monitor_cache.move_to_end(workflow_id)
         
         return {
             'status': 'success',
@@ -391,11 +531,16 @@ class MLWorkflowGenerator(BaseSkill):
 
     def _list_templates(self) -> Dict[str, Any]:
         """List available workflow templates"""
+        return self._templates_response
+
+    @cached_property
+    def _templates_response(self) -> Dict[str, Any]:
+        """Template listing, built once since templates never change (treat as read-only)"""
         templates = {}
         for (problem_type, steps) in self.workflow_templates.items():
             templates[problem_type] = {
                 'steps_count': len(steps),
-                'estimated_duration': sum((step.estimated_duration for step in steps)),
+                'estimated_duration': self._template_cache[problem_type][1],
                 'steps': [{'id': step.step_id, 'name': step.name} for step in steps]
             }
         
@@ -13,9 +13,35 @@ from datetime import datetime, timedelta
 from collections import defaultdict, Counter
 import statistics
 import os
+import sys
+from functools import lru_cache
+from operator import attrgetter
+
+# orjson is an optional, faster parser for opencode.json and the usage history
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+
+def _read_json(path: str) -> Any:
+    """Parse a JSON file, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+@lru_cache(maxsize=8)
+def _load_config(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a config file once per modification time (treat the result as read-only)"""
+    return _read_json(path)
+
+
 @dataclass
 class ModelUsage:
     """Record of a model usage instance"""
@@ -117,8 +143,7 @@ class ModelAnalytics:
     def _get_fastest_model(self, available_models: List[str]) -> Optional[str]:
         """Get the fastest model from available options"""
         try:
-            with open(self.config_path, 'r') as f:
-                config = json.load(f)
+            config = _load_config(self.config_path, os.stat(self.config_path).st_mtime_ns)
 
             models_config = config.get("models", {})
             fastest_model = None
@@ -177,10 +202,18 @@ class ModelAnalytics:
         perf['success_rate'] = perf['success_count'] / perf['total_count']
         perf['avg_time'] = perf['total_time'] / perf['total_count']
 
-        # Update overall pattern stats
-        all_usages = [u for u in self.usage_history if u.task_type == task_type]
-        pattern.success_rate = sum(1 for u in all_usages if u.success) / len(all_usages)
-        pattern.avg_response_time = sum(u.response_time for u in all_usages) / len(all_usages)
+        # Update overall pattern stats in a single pass over the history
+        task_count = 0
+        task_successes = 0
+        task_time = 0
+        for u in self.usage_history:
+            if u.task_type == task_type:
+                task_count += 1
+                task_time += u.response_time
+                if u.success:
+                    task_successes += 1
+        pattern.success_rate = task_successes / task_count
+        pattern.avg_response_time = task_time / task_count
 
         # Find best model
         best_model = None
@@ -210,61 +243,62 @@ class ModelAnalytics:
 
     def get_analytics_report(self) -> str:
         """Generate a comprehensive analytics report"""
-        report = "# Model Analytics Report\n\n"
-        report += f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+        report = ["# Model Analytics Report\n\n"]
+        report.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
 
         if not self.usage_history:
-            report += "No usage data available yet.\n"
-            return report
+            report.append("No usage data available yet.\n")
+            return "".join(report)
+
+        # Per-model and summary stats, gathered in a single pass
+        model_stats = defaultdict(lambda: {'total': 0, 'success': 0, 'time': 0.0})
+        successful_usages = 0
+        for usage in self.usage_history:
+            stats = model_stats[usage.model_id]
+            stats['total'] += 1
+            stats['time'] += usage.response_time
+            if usage.success:
+                stats['success'] += 1
+                successful_usages += 1
 
-        # Summary stats
         total_usages = len(self.usage_history)
-        successful_usages = sum(1 for u in self.usage_history if u.success)
         overall_success_rate = successful_usages / total_usages * 100
 
-        report += "## Summary\n\n"
-        report += f"- Total model usages: {total_usages}\n"
-        report += f"- Overall success rate: {overall_success_rate:.1f}%\n"
-        report += f"- Task types analyzed: {len(self.task_patterns)}\n"
-        report += f"- Models used: {len(set(u.model_id for u in self.usage_history))}\n\n"
+        report.append("## Summary\n\n")
+        report.append(f"- Total model usages: {total_usages}\n")
+        report.append(f"- Overall success rate: {overall_success_rate:.1f}%\n")
+        report.append(f"- Task types analyzed: {len(self.task_patterns)}\n")
+        report.append(f"- Models used: {len(model_stats)}\n\n")
 
         # Task patterns
         if self.task_patterns:
-            report += "## Task Performance\n\n"
-            report += "| Task Type | Usages | Success Rate | Avg Time | Best Model |\n"
-            report += "|-----------|--------|--------------|----------|------------|\n"
+            report.append("## Task Performance\n\n")
+            report.append("| Task Type | Usages | Success Rate | Avg Time | Best Model |\n")
+            report.append("|-----------|--------|--------------|----------|------------|\n")
 
-            for pattern in sorted(self.task_patterns.values(), key=lambda p: p.total_usages, reverse=True):
-                report += f"| {pattern.task_type} | {pattern.total_usages} | {pattern.success_rate:.1f}% | {pattern.avg_response_time:.2f}s | {pattern.best_model} |\n"
+            for pattern in sorted(self.task_patterns.values(), key=attrgetter('total_usages'), reverse=True):
+                report.append(f"| {pattern.task_type} | {pattern.total_usages} | {pattern.success_rate:.1f}% | {pattern.avg_response_time:.2f}s | {pattern.best_model} |\n")
 
-            report += "\n"
+            report.append("\n")
 
         # Model performance
-        model_stats = defaultdict(lambda: {'total': 0, 'success': 0, 'time': 0.0})
-        for usage in self.usage_history:
-            model_stats[usage.model_id]['total'] += 1
-            model_stats[usage.model_id]['time'] += usage.response_time
-            if usage.success:
-                model_stats[usage.model_id]['success'] += 1
-
         if model_stats:
-            report += "## Model Performance\n\n"
-            report += "| Model | Usages | Success Rate | Avg Time |\n"
-            report += "|-------|--------|--------------|----------|\n"
+            report.append("## Model Performance\n\n")
+            report.append("| Model | Usages | Success Rate | Avg Time |\n")
+            report.append("|-------|--------|--------------|----------|\n")
 
             for model, stats in sorted(model_stats.items(), key=lambda x: x[1]['total'], reverse=True):
                 success_rate = stats['success'] / stats['total'] * 100
                 avg_time = stats['time'] / stats['total']
-                report += f"| {model} | {stats['total']} | {success_rate:.1f}% | {avg_time:.2f}s |\n"
+                report.append(f"| {model} | {stats['total']} | {success_rate:.1f}% | {avg_time:.2f}s |\n")
 
-        return report
+        return "".join(report)
 
     def _load_history(self):
         """Load usage history from file"""
         try:
             if os.path.exists(self.history_file):
-                with open(self.history_file, 'r') as f:
-                    data = json.load(f)
+                data = _read_json(self.history_file)
 
                 self.usage_history = []
                 for item in data.get('usage_history', []):
@@ -276,8 +310,9 @@ class ModelAnalytics:
                         timestamp = datetime.now()
 
                     usage = ModelUsage(
-                        model_id=item['model_id'],
-                        task_type=item['task_type'],
+                        # Ids repeat across records; share one string object per id
+                        model_id=sys.intern(item['model_id']),
+                        task_type=sys.intern(item['task_type']),
                         success=item['success'],
                         response_time=item['response_time'],
                         token_count=item.get('token_count'),
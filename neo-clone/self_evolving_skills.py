@@ -14,7 +14,7 @@ from typing import Dict, List, Any, Optional, Tuple, Set
 from dataclasses import dataclass, field
 from enum import Enum
 import copy
-from collections import defaultdict
+from collections import Counter, defaultdict
 
 logger = logging.getLogger(__name__)
 
@@ -640,7 +640,7 @@ class GeneticSkillEvolver:
         
         # Skill type distribution
         type_counts = defaultdict(int)
-        capability_counts = defaultdict(int)
+        capability_counts = Counter()
         
         for skill in population:
             for gene in skill.genes:
@@ -653,8 +653,7 @@ class GeneticSkillEvolver:
         return {
             'skill_types': dict(type_counts),
             'capability_diversity': len(capability_counts),
-            'most_common_capabilities': sorted(capability_counts.items(), 
-                                            key=lambda x: x[1], reverse=True)[:10],
+            'most_common_capabilities': capability_counts.most_common(10),
             'average_complexity': np.mean(complexities) if complexities else 0.0,
             'complexity_range': (min(complexities), max(complexities)) if complexities else (0.0, 0.0)
         }
@@ -24,7 +24,7 @@ from enum import Enum
 import logging
 import pickle
 import hashlib
-from collections import defaultdict
+from collections import Counter, defaultdict
 import threading
 
 logger = logging.getLogger(__name__)
@@ -851,11 +851,10 @@ class TaskFreeManager:
     def _find_common_patterns(self) -> List[Dict]:
         """Find common patterns across models"""
         # Simplified pattern detection
-        capability_counts = defaultdict(int)
+        capability_counts = Counter()
         
         for model in self.task_free_models.values():
-            for cap_name in model.universal_capabilities:
-                capability_counts[cap_name] += 1
+            capability_counts.update(model.universal_capabilities.keys())
         
         # Find capabilities used by multiple models
         common_patterns = []
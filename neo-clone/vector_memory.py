@@ -9,6 +9,7 @@ Version: 1.0
 """
 
 import json
+import heapq
 import uuid
 import threading
 import time
@@ -17,8 +18,11 @@ from pathlib import Path
 from typing import List, Dict, Any, Optional, Union, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from functools import lru_cache
+from operator import itemgetter
 import logging
 import hashlib
+from collections import OrderedDict
 
 # Import data models
 from data_models import MemoryVector, MemoryType, SearchResult
@@ -27,6 +31,19 @@ from data_models import MemoryVector, MemoryType, SearchResult
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=8192)
+def _word_bucket(word: str, dimensions: int) -> int:
+    """
+    Map a word to its embedding index.
+    
+    Stays md5-based so embeddings persisted to disk remain comparable with
+    freshly generated ones; the cache removes the per-word digest cost.
+    """
+    word_hash = hashlib.md5(word.encode()).digest()
+    # Use first 4 bytes to get index
+    return int.from_bytes(word_hash[:4], 'big') % dimensions
+
+
 @dataclass
 class MemoryQuery:
     """Query for memory search with multiple options"""
@@ -95,6 +112,9 @@ class VectorMemoryOptimized:
         self.index: Optional[Dict[str, Any]] = None
         self.cache: Dict[str, Dict[str, Any]] = {}
         self.metadata_index: Dict[str, List[int]] = {}
+        # LRU of query text -> embedding; stored memories are not cached
+        # since their content is rarely repeated
+        self._query_embeddings: "OrderedDict[str, List[float]]" = OrderedDict()
         
         # Performance tracking
         self.search_stats = {
@@ -141,37 +161,9 @@ class VectorMemoryOptimized:
             Memory ID
         """
         with self._lock:
-            memory_id = str(uuid.uuid4())
-            
-            # Generate embedding if not provided
-            if embedding is None:
-                embedding = self._generate_embedding(content)
-            
-            # Ensure embedding dimensions
-            embedding = self._normalize_embedding(embedding)
-            
-            memory = {
-                "id": memory_id,
-                "content": content,
-                "embedding": embedding,
-                "memory_type": memory_type.value,
-                "importance": max(0.0, min(1.0, importance)),
-                "tags": tags or [],
-                "metadata": metadata or {},
-                "created_at": datetime.now().isoformat(),
-                "last_accessed": datetime.now().isoformat(),
-                "access_count": 0,
-                "search_relevance": 0.0
-            }
-            
-            # Add to vectors
-            self.vectors.append(memory)
-            
-            # Update indexes
-            if self.index:
-                self._add_to_index(memory, len(self.vectors) - 1)
-            
-            self._add_to_metadata_index(memory, len(self.vectors) - 1)
+            memory_id = self._insert_memory(
+                content, memory_type, importance, tags, metadata, embedding
+            )
             
             # Check if we need to consolidate (too many vectors)
             if len(self.vectors) > self.max_vectors:
@@ -184,6 +176,93 @@ class VectorMemoryOptimized:
             logger.debug(f"Added memory: {memory_id} (type: {memory_type.value})")
             return memory_id
     
+    def add_memories(
+        self,
+        contents: List[str],
+        memory_type: MemoryType = MemoryType.SEMANTIC,
+        importance: float = 0.5,
+        tags: Optional[List[str]] = None
+    ) -> List[str]:
+        """
+        Add several memory entries in one batch
+        
+        Takes the lock once and runs consolidation once for the whole batch,
+        which keeps bulk loads (e.g. replaying history) from paying the
+        per-entry bookkeeping of add_memory. Like add_memory, it only saves
+        to disk when the store crosses a 100-entry boundary.
+        
+        Args:
+            contents: Memory content texts
+            memory_type: Type shared by all entries
+            importance: Importance score shared by all entries
+            tags: Optional tags shared by all entries
+        
+        Returns:
+            Memory IDs in input order
+        """
+        with self._lock:
+            count_before = len(self.vectors)
+            memory_ids = [
+                self._insert_memory(content, memory_type, importance, tags, None, None)
+                for content in contents
+            ]
+            
+            if len(self.vectors) > self.max_vectors:
+                self._consolidate_vectors()
+            
+            # Save every 100 entries, as add_memory does
+            if count_before // 100 != len(self.vectors) // 100:
+                self._save_to_disk()
+            
+            logger.debug(f"Added {len(memory_ids)} memories (type: {memory_type.value})")
+            return memory_ids
+    
+    def _insert_memory(
+        self,
+        content: str,
+        memory_type: MemoryType,
+        importance: float,
+        tags: Optional[List[str]],
+        metadata: Optional[Dict[str, Any]],
+        embedding: Optional[List[float]]
+    ) -> str:
+        """Append a memory entry and index it (caller holds the lock)"""
+        memory_id = str(uuid.uuid4())
+        
+        # Generate embedding if not provided
+        if embedding is None:
+            embedding = self._generate_embedding(content)
+        
+        # Ensure embedding dimensions; generated embeddings are normalized
+        # again too, so stored scores (and the order of tied results) match
+        # entries written before add_memories existed
+        embedding = self._normalize_embedding(embedding)
+        
+        now = datetime.now().isoformat()
+        memory = {
+            "id": memory_id,
+            "content": content,
+            "embedding": embedding,
+            "memory_type": memory_type.value,
+            "importance": max(0.0, min(1.0, importance)),
+            "tags": list(tags) if tags else [],
+            "metadata": metadata or {},
+            "created_at": now,
+            "last_accessed": now,
+            "access_count": 0,
+            "search_relevance": 0.0
+        }
+        
+        # Add to vectors
+        self.vectors.append(memory)
+        
+        # Update indexes
+        if self.index:
+            self._add_to_index(memory, len(self.vectors) - 1)
+        
+        self._add_to_metadata_index(memory, len(self.vectors) - 1)
+        return memory_id
+    
     def search(
         self,
         query: Union[str, MemoryQuery],
@@ -301,9 +380,8 @@ class VectorMemoryOptimized:
         # Apply filters
         filtered_results = self._apply_filters(combined_results, query)
         
-        # Sort by relevance and return top results
-        filtered_results.sort(key=lambda x: x[1], reverse=True)
-        return filtered_results[:search_limit]
+        # Select top results by relevance (heap selection, no full sort)
+        return heapq.nlargest(search_limit, filtered_results, key=itemgetter(1))
     
     def _semantic_search(
         self,
@@ -315,8 +393,10 @@ class VectorMemoryOptimized:
         if not self.index or not self.vectors:
             return []
         
-        query_embedding = self._generate_embedding(query)
+        query_embedding = self._get_query_embedding(query)
         results = []
+        # Snapshot the access time once per scan rather than once per match
+        accessed_at = datetime.now().isoformat()
         
         for idx, vector in enumerate(self.vectors):
             # Skip if no embedding
@@ -328,13 +408,12 @@ class VectorMemoryOptimized:
             if similarity >= threshold:
                 # Update access tracking
                 vector["access_count"] += 1
-                vector["last_accessed"] = datetime.now().isoformat()
+                vector["last_accessed"] = accessed_at
                 
                 results.append((vector, similarity))
         
-        # Sort by similarity and importance
-        results.sort(key=lambda x: (x[1], x[0]["importance"]), reverse=True)
-        return results[:limit]
+        # Select top results by similarity and importance
+        return heapq.nlargest(limit, results, key=lambda x: (x[1], x[0]["importance"]))
     
     def _keyword_search(
         self,
@@ -350,40 +429,40 @@ class VectorMemoryOptimized:
         if not query_words:
             return []
         
-        # Find vectors containing query words
-        candidate_indices = set()
+        # Count matched query words per vector straight from the inverted
+        # index; each posting list holds a vector at most once, so the count
+        # is the query/content word overlap without re-splitting content
+        keyword_index = self.index.get("keywords", {})
+        overlap_counts: Dict[int, int] = {}
         for word in query_words:
-            if word in self.index.get("keywords", {}):
-                candidate_indices.update(self.index["keywords"][word])
+            for idx in keyword_index.get(word, ()):
+                overlap_counts[idx] = overlap_counts.get(idx, 0) + 1
         
-        if not candidate_indices:
+        if not overlap_counts:
             return []
         
         # Calculate overlap scores
         results = []
         query_word_count = len(query_words)
+        vector_count = len(self.vectors)
+        accessed_at = datetime.now().isoformat()
         
-        for idx in candidate_indices:
-            if idx >= len(self.vectors):
+        for idx, overlap in overlap_counts.items():
+            if idx >= vector_count:
                 continue
             
-            vector = self.vectors[idx]
-            content_words = set(vector["content"].lower().split())
+            overlap_score = overlap / query_word_count
             
-            if content_words:
-                overlap = len(query_words & content_words)
-                overlap_score = overlap / query_word_count
+            if overlap_score >= min_overlap:
+                vector = self.vectors[idx]
+                # Update access tracking
+                vector["access_count"] += 1
+                vector["last_accessed"] = accessed_at
                 
-                if overlap_score >= min_overlap:
-                    # Update access tracking
-                    vector["access_count"] += 1
-                    vector["last_accessed"] = datetime.now().isoformat()
-                    
-                    results.append((vector, overlap_score))
+                results.append((vector, overlap_score))
         
-        # Sort by overlap score and importance
-        results.sort(key=lambda x: (x[1], x[0]["importance"]), reverse=True)
-        return results[:limit]
+        # Select top results by overlap score and importance
+        return heapq.nlargest(limit, results, key=lambda x: (x[1], x[0]["importance"]))
     
     def _merge_search_results(
         self,
@@ -471,9 +550,7 @@ class VectorMemoryOptimized:
         
         for word, freq in word_freq.items():
             # Hash word to get consistent index
-            word_hash = hashlib.md5(word.encode()).digest()
-            # Use first 4 bytes to get index
-            idx = int.from_bytes(word_hash[:4], 'big') % self.embedding_dimensions
+            idx = _word_bucket(word, self.embedding_dimensions)
             
             # Weight by frequency (log-scaled to reduce impact of very common words)
             weight = math.log(1 + freq)
@@ -481,6 +558,21 @@ class VectorMemoryOptimized:
         
         return self._normalize_embedding(vector)
     
+    def _get_query_embedding(self, query: str) -> List[float]:
+        """Return the embedding for a search query, reusing recent ones"""
+        embedding = self._query_embeddings.get(query)
+        if embedding is not None:
+            self._query_embeddings.move_to_end(query)
+            self.search_stats["cache_hits"] += 1
+            return embedding
+        
+        self.search_stats["cache_misses"] += 1
+        embedding = self._generate_embedding(query)
+        self._query_embeddings[query] = embedding
+        if len(self._query_embeddings) > self.cache_size:
+            self._query_embeddings.popitem(last=False)
+        return embedding
+    
     def _normalize_embedding(self, embedding: List[float]) -> List[float]:
         """Normalize embedding vector to unit length"""
         if not embedding:
@@ -0,0 +1,270 @@
+"""
+Unit tests for the enterprise backend's request handling
+"""
+
+import asyncio
+import time
+
+import enterprise_backend as eb
+from enterprise_backend import EnterpriseBackend, EnterpriseRequest, EnterpriseSystem
+
+ANALYSIS = EnterpriseSystem.CODE_ANALYSIS_DEBUGGING
+
+
+def make_backend(tmp_path, system=ANALYSIS, operation="optimize_code", result=None):
+    """Create a backend with one initialized system and a counting handler"""
+    backend = EnterpriseBackend(str(tmp_path))
+    backend.systems[system] = {}
+    backend.system_status[system].initialized = True
+    calls = []
+
+    async def handler(components, params):
+        calls.append(params)
+        return result if result is not None else ["issue"]
+
+    backend._operation_handlers[(system, operation)] = handler
+    return backend, calls
+
+
+def request(system=ANALYSIS, operation="optimize_code", **parameters):
+    """Build a request for the given operation"""
+    return EnterpriseRequest(request_id="", system=system, operation=operation, parameters=parameters)
+
+
+def test_cacheable_operation_is_served_from_cache(tmp_path):
+    backend, calls = make_backend(tmp_path)
+
+    first = asyncio.run(backend.process_request(request(code="x = 1")))
+    second = asyncio.run(backend.process_request(request(code="x = 1")))
+
+    assert first.success and second.success
+    assert len(calls) == 1
+    assert dict(second.metadata) == {"cache": "hit"}
+    assert second.result == ["issue"]
+
+
+def test_cached_result_is_a_snapshot(tmp_path):
+    live_issues = ["issue"]
+    backend, _ = make_backend(tmp_path, result=live_issues)
+
+    asyncio.run(backend.process_request(request(code="x = 1")))
+    live_issues.append("later issue")
+    cached = asyncio.run(backend.process_request(request(code="x = 1")))
+
+    assert cached.result == ["issue"]
+
+
+def test_cache_entry_expires_after_ttl(tmp_path, monkeypatch):
+    backend = EnterpriseBackend(str(tmp_path))
+    now = [1000.0]
+    monkeypatch.setattr(eb.time, "monotonic", lambda: now[0])
+
+    backend._cache_store("key", "result", ttl=10)
+    assert backend._cache_lookup("key") == (True, "result")
+
+    now[0] += 11
+    assert backend._cache_lookup("key") == (False, None)
+    assert "key" not in backend._response_cache
+
+
+def test_cache_evicts_least_recently_used(tmp_path, monkeypatch):
+    backend = EnterpriseBackend(str(tmp_path))
+    monkeypatch.setattr(eb, "RESPONSE_CACHE_SIZE", 2)
+
+    backend._cache_store("a", 1, ttl=60)
+    backend._cache_store("b", 2, ttl=60)
+    backend._cache_lookup("a")
+    backend._cache_store("c", 3, ttl=60)
+
+    assert list(backend._response_cache) == ["a", "c"]
+
+
+def test_unserializable_parameters_bypass_cache(tmp_path):
+    backend, calls = make_backend(tmp_path)
+    parameters = {}
+    parameters["self"] = parameters
+
+    for _ in range(2):
+        response = asyncio.run(backend.process_request(request(**parameters)))
+        assert response.success
+
+    assert len(calls) == 2
+    assert not backend._response_cache
+
+
+def test_file_keyed_operation_is_invalidated_by_edit(tmp_path):
+    source = tmp_path / "module.py"
+    source.write_text("x = 1\n")
+    backend, calls = make_backend(tmp_path, operation="analyze_code")
+
+    asyncio.run(backend.process_request(request(operation="analyze_code", file_path=str(source))))
+    asyncio.run(backend.process_request(request(operation="analyze_code", file_path=str(source))))
+    assert len(calls) == 1
+
+    source.write_text("x = 1\ny = 2\n")
+    asyncio.run(backend.process_request(request(operation="analyze_code", file_path=str(source))))
+    assert len(calls) == 2
+
+
+def test_file_keyed_operation_on_missing_file_is_not_cached(tmp_path):
+    backend, calls = make_backend(tmp_path, operation="analyze_code")
+    missing = str(tmp_path / "missing.py")
+
+    for _ in range(2):
+        asyncio.run(backend.process_request(request(operation="analyze_code", file_path=missing)))
+
+    assert len(calls) == 2
+    assert not backend._response_cache
+
+
+def test_remote_fetches_are_not_cacheable():
+    assert (EnterpriseSystem.ENHANCED_WEB_RESEARCH, "extract_content") not in eb.CACHEABLE_OPERATIONS
+
+
+def test_shared_analyzer_is_not_used_concurrently(tmp_path):
+    class SharedAnalyzer:
+        """Mimics CodeAnalyzer: results accumulate on the instance"""
+
+        def __init__(self):
+            self.issues = []
+            self.active = 0
+            self.max_active = 0
+
+        def analyze_file(self, file_path):
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            self.issues = [file_path]
+            time.sleep(0.01)
+            self.active -= 1
+            return self.issues
+
+    backend = EnterpriseBackend(str(tmp_path))
+    analyzer = SharedAnalyzer()
+    backend.systems[ANALYSIS] = {"analyzer": analyzer}
+    backend.system_status[ANALYSIS].initialized = True
+    paths = [str(tmp_path / f"missing_{i}.py") for i in range(8)]
+
+    async def run_all():
+        return await asyncio.gather(
+            *(backend.process_request(request(operation="analyze_code", file_path=path)) for path in paths)
+        )
+
+    responses = asyncio.run(run_all())
+
+    assert analyzer.max_active == 1
+    assert [response.result for response in responses] == [[path] for path in paths]
+
+
+def lazy_backend(tmp_path, factory, system=ANALYSIS, operation="optimize_code"):
+    """Create an uninitialized backend whose system is built by factory on first use"""
+    backend = EnterpriseBackend(str(tmp_path))
+    backend._system_factories[system] = factory
+
+    async def handler(components, params):
+        return components["engine"]
+
+    backend._operation_handlers[(system, operation)] = handler
+    return backend
+
+
+def test_lazy_system_initializes_on_first_request(tmp_path):
+    built = []
+
+    def factory():
+        built.append(True)
+        return {"engine": "ready"}
+
+    backend = lazy_backend(tmp_path, factory)
+    assert not backend.system_status[ANALYSIS].initialized
+
+    first = asyncio.run(backend.process_request(request(code="x = 1")))
+    second = asyncio.run(backend.process_request(request(code="y = 2")))
+
+    assert first.success and second.success
+    assert first.result == "ready"
+    assert built == [True]
+    assert backend.system_status[ANALYSIS].initialized
+
+
+def test_failed_lazy_init_fails_fast(tmp_path):
+    attempts = []
+
+    def factory():
+        attempts.append(True)
+        raise ImportError("missing dependency")
+
+    backend = lazy_backend(tmp_path, factory)
+
+    for _ in range(2):
+        response = asyncio.run(backend.process_request(request(code="x = 1")))
+        assert not response.success
+        assert "not initialized" in response.error_message
+
+    assert len(attempts) == 1
+
+
+def test_backend_is_initialized_once_every_system_is_up(tmp_path):
+    backend = EnterpriseBackend(str(tmp_path))
+    for system in EnterpriseSystem:
+        backend._system_factories[system] = dict
+
+    systems = list(EnterpriseSystem)
+    for system in systems[:-1]:
+        assert asyncio.run(backend._ensure_initialized(system))
+        assert not backend.initialized
+
+    assert asyncio.run(backend._ensure_initialized(systems[-1]))
+    assert backend.initialized
+
+
+def test_only_stateful_systems_are_serialized(tmp_path):
+    backend = EnterpriseBackend(str(tmp_path), max_concurrency_per_system=4)
+
+    async def limits():
+        return {system: backend._get_semaphore(system)._value for system in EnterpriseSystem}
+
+    for system, limit in asyncio.run(limits()).items():
+        assert limit == (1 if system in eb.SERIALIZED_SYSTEMS else 4)
+
+
+def test_cache_hits_are_independent_copies(tmp_path):
+    backend, _ = make_backend(tmp_path)
+
+    asyncio.run(backend.process_request(request(code="x = 1")))
+    hit = asyncio.run(backend.process_request(request(code="x = 1")))
+    hit.result.append("caller edit")
+    again = asyncio.run(backend.process_request(request(code="x = 1")))
+
+    assert again.result == ["issue"]
+
+
+def test_live_model_recommendations_are_not_cacheable():
+    assert (EnterpriseSystem.AI_MODEL_INTEGRATION, "get_recommendations") not in eb.CACHEABLE_OPERATIONS
+
+
+def test_timed_out_request_fails_and_frees_its_slot(tmp_path):
+    backend, calls = make_backend(tmp_path)
+
+    async def slow_handler(components, params):
+        await asyncio.to_thread(time.sleep, 0.5)
+
+    backend._operation_handlers[(ANALYSIS, "debug_code")] = slow_handler
+    slow = request(operation="debug_code")
+    slow.timeout = 0.05
+
+    async def run():
+        started = time.monotonic()
+        timed_out = await backend.process_request(slow)
+        elapsed = time.monotonic() - started
+        # The abandoned worker thread is still sleeping; the next request
+        # must not queue behind it
+        follow_up = await asyncio.wait_for(backend.process_request(request(code="x = 1")), timeout=0.3)
+        return timed_out, elapsed, follow_up
+
+    timed_out, elapsed, follow_up = asyncio.run(run())
+
+    assert not timed_out.success
+    assert timed_out.error_message == "code_analysis_debugging.debug_code timed out after 0.05s"
+    assert elapsed < 0.4
+    assert not backend._get_semaphore(ANALYSIS).locked()
+    assert follow_up.success and len(calls) == 1
@@ -0,0 +1,130 @@
+"""
+Unit tests for the ML workflow generator
+"""
+
+import importlib
+import os
+import sys
+import types
+
+import pytest
+
+
+@pytest.fixture
+def mlwg(monkeypatch):
+    """Import ml_workflow_generator against a minimal skills module
+
+    The real skills package pulls in the full configuration stack, which
+    these tests do not need.
+    """
+    skills = types.ModuleType("skills")
+    skills.BaseSkill = type("BaseSkill", (), {"__init__": lambda self, **kwargs: None})
+    skills.SkillResult = type("SkillResult", (), {})
+    monkeypatch.setitem(sys.modules, "skills", skills)
+    sys.modules.pop("ml_workflow_generator", None)
+    yield importlib.import_module("ml_workflow_generator")
+    # Drop the module again so nothing else picks up the stand-in skills
+    sys.modules.pop("ml_workflow_generator", None)
+
+
+@pytest.fixture
+def generator_class(mlwg):
+    return mlwg.MLWorkflowGenerator
+
+
+def step(step_id, *dependencies):
+    """Build a serialized workflow step"""
+    return {"step_id": step_id, "dependencies": list(dependencies), "estimated_duration": 1.0}
+
+
+def step_ids(levels):
+    return [sorted(s["step_id"] for s in level) for level in levels]
+
+
+def test_schedule_levels_orders_steps_by_dependency(generator_class):
+    steps = [step("d", "b", "c"), step("b", "a"), step("a"), step("c", "a")]
+
+    levels = generator_class._schedule_levels(steps)
+
+    assert step_ids(levels) == [["a"], ["b", "c"], ["d"]]
+
+
+def test_schedule_levels_rejects_cycles(generator_class):
+    steps = [step("a"), step("b", "c"), step("c", "b")]
+
+    with pytest.raises(ValueError, match="Unresolvable step dependencies: b, c"):
+        generator_class._schedule_levels(steps)
+
+
+def test_schedule_levels_rejects_unknown_dependencies(generator_class):
+    steps = [step("a"), step("b", "missing")]
+
+    with pytest.raises(ValueError, match="Unresolvable step dependencies: b"):
+        generator_class._schedule_levels(steps)
+
+
+def test_workflows_created_back_to_back_do_not_collide(generator_class, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    generator = generator_class()
+
+    first = generator._create_workflow({"project_name": "churn"})
+    second = generator._create_workflow({"project_name": "fraud", "problem_type": "regression"})
+
+    assert first["workflow_id"] != second["workflow_id"]
+    assert first["workflow_file"] != second["workflow_file"]
+    plans = {workflow_id: plan["config"]["project_name"] for workflow_id, plan in generator._workflow_plans.items()}
+    assert plans == {first["workflow_id"]: "churn", second["workflow_id"]: "fraud"}
+    assert (tmp_path / first["workflow_file"]).exists()
+    assert (tmp_path / second["workflow_file"]).exists()
+
+
+def results(status):
+    """Build a results file payload as _execute_workflow writes it"""
+    return {
+        "status": status, "successful_steps": 1, "total_steps": 1, "execution_time": 1.0,
+        "success_rate": 1.0, "artifacts": [], "completed_at": "2024-01-01T00:00:00",
+    }
+
+
+def test_monitor_sees_rewrite_within_one_mtime_tick(mlwg, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    generator = mlwg.MLWorkflowGenerator()
+    results_file = tmp_path / "wf_results.json"
+
+    mlwg._write_json(results_file, results("running"))
+    mtime_ns = results_file.stat().st_mtime_ns
+    assert generator._monitor_workflow({"workflow_id": "wf"})["current_status"] == "running"
+
+    # Same size and, as on a coarse-timestamp filesystem, the same mtime
+    mlwg._write_json(results_file, results("done!!!"))
+    os.utime(results_file, ns=(mtime_ns, mtime_ns))
+
+    assert generator._monitor_workflow({"workflow_id": "wf"})["current_status"] == "done!!!"
+
+
+def test_write_json_replaces_file_without_leaving_temp(mlwg, tmp_path):
+    target = tmp_path / "plan.json"
+
+    mlwg._write_json(target, {"version": 1})
+    mlwg._write_json(target, {"version": 2}, pretty=True)
+
+    assert mlwg._read_json(target) == {"version": 2}
+    assert [p.name for p in tmp_path.iterdir()] == ["plan.json"]
+
+
+def test_write_json_failure_keeps_old_file(mlwg, tmp_path, monkeypatch):
+    target = tmp_path / "plan.json"
+    mlwg._write_json(target, {"version": 1})
+
+    with pytest.raises(TypeError):
+        mlwg._write_json(target, {"version": object()})
+
+    def failing_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(mlwg.os, "replace", failing_replace)
+    with pytest.raises(OSError):
+        mlwg._write_json(target, {"version": 2})
+
+    assert mlwg._read_json(target) == {"version": 1}
+    assert [p.name for p in tmp_path.iterdir()] == ["plan.json"]
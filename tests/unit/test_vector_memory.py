@@ -0,0 +1,71 @@
+"""
+Unit tests for batched inserts into the vector memory store
+"""
+
+import pytest
+
+from vector_memory import VectorMemoryOptimized
+
+# Repeated texts give exactly tied scores, so result order is checked too
+CONTENTS = [f"{('python', 'caching')[i % 2]} note {i % 7} about item {i % 3}" for i in range(120)]
+
+
+@pytest.fixture
+def make_memory(tmp_path, monkeypatch):
+    """Create stores without the background consolidation thread"""
+    monkeypatch.setattr(VectorMemoryOptimized, "_start_background_tasks", lambda self: None)
+    counter = iter(range(100))
+
+    def factory():
+        return VectorMemoryOptimized(str(tmp_path / f"store_{next(counter)}"))
+
+    return factory
+
+
+def count_saves(memory, monkeypatch):
+    """Replace a store's disk save with a counter"""
+    saves = []
+    monkeypatch.setattr(memory, "_save_to_disk", lambda: saves.append(len(memory.vectors)))
+    return saves
+
+
+def test_batched_embeddings_match_single_inserts(make_memory):
+    single, batched = make_memory(), make_memory()
+
+    for content in CONTENTS:
+        single.add_memory(content)
+    batched.add_memories(CONTENTS)
+
+    assert [v["embedding"] for v in batched.vectors] == [v["embedding"] for v in single.vectors]
+    assert batched.vectors[0]["embedding"] == single._normalize_embedding(
+        single._generate_embedding(CONTENTS[0])
+    )
+
+
+def test_batched_inserts_save_on_100_entry_boundary(make_memory, monkeypatch):
+    memory = make_memory()
+    saves = count_saves(memory, monkeypatch)
+
+    memory.add_memories(CONTENTS[:50])
+    assert saves == []
+    memory.add_memories(CONTENTS[50:110])
+    assert saves == [110]
+    memory.add_memories(CONTENTS[110:])
+    assert saves == [110]
+    memory.add_memories([])
+    assert saves == [110]
+
+
+def test_batched_inserts_return_same_search_results(make_memory):
+    single, batched = make_memory(), make_memory()
+
+    for content in CONTENTS:
+        single.add_memory(content)
+    batched.add_memories(CONTENTS)
+
+    for query in ("python note", "caching item 2", "about python and item 1", "note 3"):
+        expected = single.search(query, limit=10)
+        results = batched.search(query, limit=10)
+        assert [(r.content, r.relevance_score) for r in results] == [
+            (r.content, r.relevance_score) for r in expected
+        ]